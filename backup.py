@@ -0,0 +1,171 @@
+# backup.py
+# نسخ احتياطي حي لقاعدة SQLite بواجهة backup التدريجية، مع ضغط وتدوير
+# واستعادة آخر نسخة عند بدء التشغيل إن لم تكن القاعدة موجودة
+import os
+import gzip
+import time
+import fcntl
+import logging
+import shutil
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from typing import List, Optional
+
+import database
+from metrics import BACKUP_LAST_SUCCESS
+
+BACKUP_DIR = os.getenv("BACKUP_DIR", "backups")
+BACKUP_INTERVAL = float(os.getenv("BACKUP_INTERVAL", "3600"))
+BACKUP_KEEP = int(os.getenv("BACKUP_KEEP", "24"))
+# صفحات كل خطوة والاستراحة بينها؛ القفل يُحرر بين الخطوات فلا يتأخر الكتّاب
+BACKUP_PAGES = int(os.getenv("BACKUP_PAGES", "256"))
+BACKUP_SLEEP = float(os.getenv("BACKUP_SLEEP", "0.005"))
+# إعادة البدء تحدث إذا كتب اتصال آخر أثناء النسخ؛ بعدها يُنسخ الباقي في خطوة واحدة
+BACKUP_MAX_RESTARTS = 3
+PREFIX = "database-"
+SUFFIX = ".db.gz"
+
+
+class BackupBusy(Exception):
+    pass
+
+
+class _TooManyRestarts(Exception):
+    pass
+
+
+@contextmanager
+def _exclusive(blocking: bool = True):
+    """قفل ملف في مجلد النسخ حتى لا يعمل عاملان على النسخ أو الاستعادة معاً"""
+    os.makedirs(BACKUP_DIR, exist_ok=True)
+    with open(os.path.join(BACKUP_DIR, ".lock"), "w") as f:
+        try:
+            fcntl.flock(f, fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB))
+        except BlockingIOError:
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def list_backups() -> List[str]:
+    """مسارات النسخ من الأحدث للأقدم"""
+    if not os.path.isdir(BACKUP_DIR):
+        return []
+    names = [n for n in os.listdir(BACKUP_DIR) if n.startswith(PREFIX) and n.endswith(SUFFIX)]
+    return [os.path.join(BACKUP_DIR, n) for n in sorted(names, reverse=True)]
+
+
+def _copy(src: sqlite3.Connection, dst: sqlite3.Connection):
+    restarts = 0
+    last_remaining = None
+
+    def progress(status, remaining, total):
+        nonlocal restarts, last_remaining
+        if last_remaining is not None and remaining > last_remaining:
+            restarts += 1
+            if restarts > BACKUP_MAX_RESTARTS:
+                raise _TooManyRestarts()
+        last_remaining = remaining
+
+    try:
+        src.backup(dst, pages=BACKUP_PAGES, progress=progress, sleep=BACKUP_SLEEP)
+    except _TooManyRestarts:
+        # في وضع WAL القراءة في خطوة واحدة لا تمنع الكتّاب
+        src.backup(dst, pages=-1)
+
+
+def _create_backup() -> dict:
+    """نسخة متسقة مضغوطة من القاعدة، تُكتب في ملف مؤقت ثم تُعاد تسميته"""
+    start = time.monotonic()
+    stamp = datetime.utcnow().strftime("%Y%m%dT%H%M%S%f")
+    path = os.path.join(BACKUP_DIR, f"{PREFIX}{stamp}{SUFFIX}")
+    raw = path + ".tmp-db"
+
+    src = sqlite3.connect(database.DB_PATH)
+    dst = sqlite3.connect(raw)
+    try:
+        _copy(src, dst)
+        if dst.execute("PRAGMA quick_check").fetchone()[0] != "ok":
+            raise sqlite3.DatabaseError("backup failed quick_check")
+    finally:
+        dst.close()
+        src.close()
+
+    try:
+        with open(raw, "rb") as f_in, gzip.open(path + ".tmp", "wb", compresslevel=6) as f_out:
+            shutil.copyfileobj(f_in, f_out, 1024 * 1024)
+        with open(path + ".tmp", "rb") as f:
+            os.fsync(f.fileno())
+        os.replace(path + ".tmp", path)
+    finally:
+        for leftover in (raw, path + ".tmp"):
+            if os.path.exists(leftover):
+                os.remove(leftover)
+
+    for old in list_backups()[BACKUP_KEEP:]:
+        os.remove(old)
+    BACKUP_LAST_SUCCESS.set(time.time())
+    return {
+        "path": path,
+        "size": os.path.getsize(path),
+        "seconds": round(time.monotonic() - start, 3)
+    }
+
+
+def create_backup() -> dict:
+    """نسخة فورية؛ BackupBusy إن كانت هناك نسخة جارية في عامل آخر"""
+    with _exclusive(blocking=False) as acquired:
+        if not acquired:
+            raise BackupBusy()
+        return _create_backup()
+
+
+def restore_if_missing() -> Optional[str]:
+    """استعادة أحدث نسخة إذا لم يكن ملف القاعدة موجوداً (مثل إعادة تشغيل تمسح /tmp)"""
+    if os.path.exists(database.DB_PATH):
+        return None
+    with _exclusive():
+        # عامل آخر ربما استعاد القاعدة أثناء انتظار القفل
+        if os.path.exists(database.DB_PATH):
+            return None
+        backups = list_backups()
+        if not backups:
+            return None
+        directory = os.path.dirname(database.DB_PATH)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp = database.DB_PATH + ".restore"
+        with gzip.open(backups[0], "rb") as f_in, open(tmp, "wb") as f_out:
+            shutil.copyfileobj(f_in, f_out, 1024 * 1024)
+        # ملفات WAL متبقية من قاعدة أخرى ستُطبّق على النسخة المستعادة وتفسدها
+        for stale in (database.DB_PATH + "-wal", database.DB_PATH + "-shm"):
+            if os.path.exists(stale):
+                os.remove(stale)
+        os.replace(tmp, database.DB_PATH)
+        return backups[0]
+
+
+def _latest_age() -> float:
+    backups = list_backups()
+    if not backups:
+        return float("inf")
+    return time.time() - os.path.getmtime(backups[0])
+
+
+def backup_scheduler(stop: threading.Event):
+    """يعمل في كل عامل؛ العامل الذي يحصل على القفل ينسخ إذا مضت BACKUP_INTERVAL على آخر نسخة"""
+    while not stop.wait(min(BACKUP_INTERVAL, 60)):
+        if _latest_age() < BACKUP_INTERVAL:
+            continue
+        with _exclusive(blocking=False) as acquired:
+            if acquired and _latest_age() >= BACKUP_INTERVAL:
+                try:
+                    _create_backup()
+                except (OSError, sqlite3.Error):
+                    # تُعاد المحاولة في الدورة التالية
+                    logging.getLogger("backup").exception("Scheduled backup failed")
@@ -0,0 +1,192 @@
+# bench.py
+# قياسات أداء محلية: python bench.py [json|search|rss|startup]
+import os
+import sys
+import json
+import time
+import signal
+import warnings
+import subprocess
+import urllib.request
+
+warnings.filterwarnings("ignore")
+
+
+def _timeit(fn, repeat=50):
+    fn()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def bench_json():
+    """تسلسل الاستجابات الكبيرة: المسار القديم (jsonable_encoder ثم json القياسية) مقابل ما يفعله
+    كل مسار الآن؛ المسارات التي تعيد dict ما زالت تمر بـ jsonable_encoder قبل FastJSONResponse"""
+    from fastapi.encoders import jsonable_encoder
+    from fastapi.responses import JSONResponse, Response
+    from catalog import load_catalog
+    import fast_json
+
+    catalog = load_catalog()
+    structure = {"structure": catalog.full_structure()}
+    codes = [
+        {
+            "id": i,
+            "code": f"{i:016X}",
+            "active": i % 3 != 0,
+            "expires_at": "2026-01-01T00:00:00",
+            "usage_limit": 45,
+            "usage_count": i % 45,
+            "expired": i % 5 == 0,
+        }
+        for i in range(20000)
+    ]
+    search = {
+        "results": [
+            {"score": 12.5, "report_id": r.id, "report_name": r.name, "subcategory_id": r.subcategory_id}
+            for r in catalog.reports[:100]
+        ],
+        "total": len(catalog.reports), "limit": 100, "offset": 0,
+    }
+    escaped = len(json.dumps(structure).encode())
+
+    print(f"orjson available: {fast_json.orjson is not None}")
+    print(f"full-structure size: {len(fast_json.dumps(structure))} bytes (ascii-escaped: {escaped})")
+    cases = (
+        # /api/full-structure: بايتات مبنية مع نسخة الكتالوج
+        ("full-structure", structure, lambda: Response(catalog.payloads["full_structure"])),
+        # /admin/codes: FastJSONResponse مباشرة دون jsonable_encoder
+        ("admin codes x20000", codes, lambda: fast_json.FastJSONResponse(codes)),
+        # مسار يعيد dict مثل /api/search-reports: jsonable_encoder ثم default_response_class
+        ("search x100 (dict)", search, lambda: fast_json.FastJSONResponse(jsonable_encoder(search))),
+    )
+    for name, payload, route in cases:
+        stdlib = _timeit(lambda: JSONResponse(jsonable_encoder(payload)))
+        now = _timeit(route)
+        print(f"{name:20} stdlib+encoder {stdlib:8.2f} ms   route {now:8.2f} ms   x{stdlib / now:.1f}")
+
+
+SEARCH_QUERIES = ("ال", "تقرير عن", "تقرير عن تنفيذ", "خطة علاجية", "الطابور")
+
+
+def bench_search(size=1200):
+    """البحث بالفهرس مقابل المسح النصي القديم على كتالوج مكرر حتى size تقرير"""
+    from catalog import load_catalog
+    from search import ReportIndex
+
+    catalog = load_catalog()
+    docs = [(r, catalog.subcategories_by_id[r.subcategory_id].criterion_id) for r in catalog.reports]
+    docs = (docs * (size // len(docs) + 1))[:size]
+    index = ReportIndex(docs)
+    names = [r.name for r, _ in docs]
+
+    print(f"reports: {len(index)}")
+    for q in SEARCH_QUERIES:
+        lowered = q.lower()
+        scan = _timeit(lambda: [n for n in names if lowered in n.lower()][:20], repeat=500)
+        indexed = _timeit(lambda: index.search(q), repeat=500)
+        fuzzy = _timeit(lambda: index.fuzzy_search(q), repeat=200)
+        total, _ = index.search(q)
+        print(f"{q:16} matches {total:5}   scan {scan:6.3f} ms   index {indexed:6.3f} ms   fuzzy {fuzzy:6.3f} ms")
+
+
+def _memory(pid):
+    """Rss وPss (الحصة الفعلية بعد احتساب الصفحات المشتركة) بالميغابايت"""
+    values = {}
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            parts = line.split()
+            if parts[0] in ("Rss:", "Pss:", "Private_Dirty:"):
+                values[parts[0][:-1]] = int(parts[1]) / 1024
+    return values
+
+
+def _run_gunicorn(preload: bool, workers: int = 4, port: int = 8765):
+    env = dict(os.environ, GUNICORN_PRELOAD="1" if preload else "0", WEB_CONCURRENCY=str(workers), PORT=str(port))
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "main:app", "--access-logfile", "/dev/null"],
+        env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        base = f"http://127.0.0.1:{port}"
+        for _ in range(200):
+            try:
+                urllib.request.urlopen(base + "/", timeout=1)
+                break
+            except OSError:
+                time.sleep(0.2)
+        # طلبات كافية ليخدم كل عامل الكتالوج والبحث مرة على الأقل
+        for _ in range(workers * 20):
+            urllib.request.urlopen(base + "/api/full-structure").read()
+            urllib.request.urlopen(base + "/api/search-reports?q=%D8%A7%D9%84%D8%B7%D8%A7%D8%A8%D9%88%D8%B1").read()
+        time.sleep(1)
+        children = open(f"/proc/{proc.pid}/task/{proc.pid}/children").read().split()
+        return [_memory(pid) for pid in children]
+    finally:
+        proc.send_signal(signal.SIGTERM)
+        proc.wait(timeout=30)
+
+
+def bench_rss():
+    """ذاكرة كل عامل gunicorn مع preload_app وبدونه"""
+    for preload in (False, True):
+        stats = _run_gunicorn(preload)
+        avg = {k: sum(s[k] for s in stats) / len(stats) for k in stats[0]}
+        print(
+            f"preload={str(preload):5}  workers={len(stats)}  "
+            f"avg Rss {avg['Rss']:.1f} MB  Pss {avg['Pss']:.1f} MB  Private_Dirty {avg['Private_Dirty']:.1f} MB"
+        )
+
+
+_STARTUP_SCRIPT = """
+import sys, time, warnings
+warnings.filterwarnings("ignore")
+start = time.perf_counter()
+if sys.argv[1] == "eager":
+    import google.generativeai
+import main
+imported = time.perf_counter()
+from fastapi.testclient import TestClient
+with TestClient(main.app) as client:
+    ready = time.perf_counter()
+    client.get("/api/criteria")
+    first = time.perf_counter()
+    sdk_start = time.perf_counter()
+    import gemini
+    gemini.sdk()
+    sdk = time.perf_counter() - sdk_start
+print((imported - start) * 1000, (first - ready) * 1000, (first - start) * 1000, sdk * 1000)
+"""
+
+
+def bench_startup(repeat=5):
+    """زمن الإقلاع البارد: استيراد main وأول طلب، مع استيراد Gemini مسبقاً وبدونه"""
+    env = dict(os.environ, GEMINI_WARMUP="0")
+    for mode in ("eager", "lazy"):
+        runs = []
+        for _ in range(repeat):
+            out = subprocess.run(
+                [sys.executable, "-c", _STARTUP_SCRIPT, mode],
+                env=env, capture_output=True, text=True, check=True
+            ).stdout.split()
+            runs.append([float(v) for v in out])
+        imported, first, total, sdk = (sorted(col)[len(col) // 2] for col in zip(*runs))
+        print(
+            f"{mode:5}  import main {imported:7.1f} ms  first request {first:5.1f} ms  "
+            f"start→first response {total:7.1f} ms  SDK import on first generation {sdk:7.1f} ms"
+        )
+
+
+BENCHMARKS = {
+    "json": bench_json,
+    "search": bench_search,
+    "rss": bench_rss,
+    "startup": bench_startup,
+}
+
+if __name__ == "__main__":
+    names = sys.argv[1:] or list(BENCHMARKS)
+    for name in names:
+        print(f"== {name}")
+        BENCHMARKS[name]()
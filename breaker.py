@@ -0,0 +1,126 @@
+# breaker.py
+# قاطع دائرة (closed / open / half_open) على نسبة الأخطاء والاستدعاءات البطيئة
+# خلال نافذة زمنية منزلقة. الحالة في ذاكرة كل عامل
+import os
+import time
+import threading
+from collections import deque
+
+BREAKER_WINDOW = float(os.getenv("BREAKER_WINDOW", "60"))
+BREAKER_MIN_CALLS = int(os.getenv("BREAKER_MIN_CALLS", "10"))
+BREAKER_ERROR_RATE = float(os.getenv("BREAKER_ERROR_RATE", "0.5"))
+BREAKER_SLOW_SECONDS = float(os.getenv("BREAKER_SLOW_SECONDS", "20"))
+BREAKER_SLOW_RATE = float(os.getenv("BREAKER_SLOW_RATE", "0.5"))
+BREAKER_OPEN_SECONDS = float(os.getenv("BREAKER_OPEN_SECONDS", "30"))
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+class CircuitBreaker:
+    def __init__(self, name: str):
+        self.name = name
+        self.lock = threading.Lock()
+        self.state = CLOSED
+        self.calls = deque()
+        self.errors = 0
+        self.slow = 0
+        self.opened_at = 0.0
+        self.probe_at = None
+        self.on_change = None
+
+    def _set_state(self, state: str):
+        self.state = state
+        if self.on_change:
+            self.on_change(self, state)
+
+    def _trim(self, now: float):
+        while self.calls and self.calls[0][0] < now - BREAKER_WINDOW:
+            _, failed, slow = self.calls.popleft()
+            self.errors -= failed
+            self.slow -= slow
+
+    def _open(self, now: float):
+        self.opened_at = now
+        self.probe_at = None
+        self.calls.clear()
+        self.errors = self.slow = 0
+        self._set_state(OPEN)
+
+    def allow(self) -> bool:
+        """هل يُسمح باستدعاء الآن؛ في half_open يُسمح باستدعاء تجريبي واحد"""
+        with self.lock:
+            if self.state == CLOSED:
+                return True
+            now = time.monotonic()
+            if self.state == OPEN:
+                if now - self.opened_at < BREAKER_OPEN_SECONDS:
+                    return False
+                self.probe_at = None
+                self._set_state(HALF_OPEN)
+            # استدعاء تجريبي لم تصل نتيجته بعد؛ بعد المهلة يُفترض أنه ضاع
+            if self.probe_at is not None and now - self.probe_at < BREAKER_OPEN_SECONDS:
+                return False
+            self.probe_at = now
+            return True
+
+    def release(self):
+        """إلغاء حجز الاستدعاء التجريبي إن لم يُنفَّذ"""
+        with self.lock:
+            if self.state == HALF_OPEN:
+                self.probe_at = None
+
+    def record(self, ok: bool, duration: float):
+        slow = duration >= BREAKER_SLOW_SECONDS
+        failed = not ok
+        with self.lock:
+            now = time.monotonic()
+            if self.state == OPEN:
+                # استدعاء بدأ قبل الفتح
+                return
+            if self.state == HALF_OPEN:
+                if failed or slow:
+                    self._open(now)
+                else:
+                    self.probe_at = None
+                    self._set_state(CLOSED)
+                return
+
+            self.calls.append((now, failed, slow))
+            self.errors += failed
+            self.slow += slow
+            self._trim(now)
+            total = len(self.calls)
+            if total >= BREAKER_MIN_CALLS and (
+                self.errors / total >= BREAKER_ERROR_RATE or self.slow / total >= BREAKER_SLOW_RATE
+            ):
+                self._open(now)
+
+    def retry_after(self) -> float:
+        """الثواني المتبقية حتى السماح باستدعاء تجريبي"""
+        with self.lock:
+            if self.state != OPEN:
+                return 0.0
+            return max(0.0, BREAKER_OPEN_SECONDS - (time.monotonic() - self.opened_at))
+
+    def reset(self):
+        with self.lock:
+            self.calls.clear()
+            self.errors = self.slow = 0
+            self.probe_at = None
+            self._set_state(CLOSED)
+
+    def snapshot(self) -> dict:
+        with self.lock:
+            now = time.monotonic()
+            self._trim(now)
+            return {
+                "name": self.name,
+                "state": self.state,
+                "calls": len(self.calls),
+                "errors": self.errors,
+                "slow": self.slow,
+                "open_for": round(now - self.opened_at, 1) if self.state != CLOSED else None,
+            }
@@ -0,0 +1,95 @@
+# bulk.py
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from database import get_connection
+from changes import record_changes
+from history import delete_history
+from metrics import db_timer
+
+CHUNK_SIZE = 500
+ACTIONS = ("enable", "disable", "toggle", "delete", "extend")
+
+
+def _chunks(items, size=CHUNK_SIZE):
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+@db_timer("admin")
+def apply_bulk(
+    action: str,
+    ids: Optional[List[int]] = None,
+    where: str = "",
+    params: Optional[dict] = None,
+    extend_days: int = 0,
+    extend_minutes: int = 0,
+    add_usage: int = 0,
+) -> dict:
+    """تنفيذ إجراء على مجموعة أكواد (قائمة معرفات و/أو شرط) في معاملة واحدة"""
+    conn = get_connection()
+    cur = conn.cursor()
+    try:
+        cur.execute("BEGIN IMMEDIATE")
+
+        if where:
+            cur.execute(f"SELECT id FROM activation_codes WHERE {where}", params or {})
+            matched = [row[0] for row in cur.fetchall()]
+            if ids is not None:
+                wanted = set(ids)
+                matched = [code_id for code_id in matched if code_id in wanted]
+        else:
+            matched = []
+            for chunk in _chunks(list(dict.fromkeys(ids or []))):
+                placeholders = ",".join("?" * len(chunk))
+                cur.execute(f"SELECT id FROM activation_codes WHERE id IN ({placeholders})", chunk)
+                matched.extend(row[0] for row in cur.fetchall())
+
+        now = datetime.utcnow()
+        delta = timedelta(days=extend_days, minutes=extend_minutes)
+        for chunk in _chunks(matched):
+            placeholders = ",".join("?" * len(chunk))
+            if action == "delete":
+                cur.execute(f"DELETE FROM activation_codes WHERE id IN ({placeholders})", chunk)
+                delete_history(cur, chunk)
+            elif action in ("enable", "disable"):
+                cur.execute(
+                    f"UPDATE activation_codes SET is_active = ? WHERE id IN ({placeholders})",
+                    [1 if action == "enable" else 0] + chunk
+                )
+            elif action == "toggle":
+                cur.execute(f"""
+                    UPDATE activation_codes
+                    SET is_active = CASE WHEN is_active=1 THEN 0 ELSE 1 END
+                    WHERE id IN ({placeholders})
+                """, chunk)
+            elif action == "extend":
+                # التمديد يبدأ من تاريخ الانتهاء أو من الآن أيهما أبعد
+                if delta:
+                    cur.execute(
+                        f"SELECT id, expires_at FROM activation_codes WHERE id IN ({placeholders}) AND expires_at IS NOT NULL",
+                        chunk
+                    )
+                    cur.executemany(
+                        "UPDATE activation_codes SET expires_at = ? WHERE id = ?",
+                        [
+                            ((max(datetime.fromisoformat(expires_at), now) + delta).isoformat(), code_id)
+                            for code_id, expires_at in cur.fetchall()
+                        ]
+                    )
+                if add_usage:
+                    cur.execute(f"""
+                        UPDATE activation_codes
+                        SET usage_limit = usage_limit + ?
+                        WHERE id IN ({placeholders}) AND usage_limit IS NOT NULL
+                    """, [add_usage] + chunk)
+            record_changes(cur, chunk, action)
+
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+    return {"action": action, "affected": len(matched)}
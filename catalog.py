@@ -0,0 +1,341 @@
+# catalog.py
+import os
+import sys
+import json
+import hashlib
+import time
+import logging
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from database import get_connection
+from fast_json import dumps
+from search import ReportIndex
+
+CATALOG_PATH = os.getenv("CATALOG_PATH", str(Path(__file__).with_name("catalog.json")))
+SCHEMA_VERSION = 1
+HISTORY_SIZE = int(os.getenv("CATALOG_HISTORY_SIZE", "20"))
+
+LOOKUP_NAMES = (
+    "education_offices",
+    "school_subjects",
+    "school_grades",
+    "target_audiences",
+    "implementation_places",
+    "educational_tools",
+)
+
+
+logger = logging.getLogger(__name__)
+
+
+class CatalogError(ValueError):
+    pass
+
+
+def _digest(obj) -> str:
+    return hashlib.sha256(json.dumps(obj, ensure_ascii=False, sort_keys=True).encode("utf-8")).hexdigest()[:12]
+
+
+# ---------- سجلات الكتالوج ----------
+class Criterion:
+    __slots__ = ("id", "name", "weight", "order")
+
+    def __init__(self, id, name, weight, order):
+        self.id = sys.intern(id)
+        self.name = name
+        self.weight = sys.intern(weight)
+        self.order = order
+
+    def as_dict(self):
+        return {"id": self.id, "name": self.name, "weight": self.weight, "order": self.order}
+
+
+class Subcategory:
+    __slots__ = ("id", "criterion_id", "name", "order")
+
+    def __init__(self, id, criterion_id, name, order):
+        self.id = sys.intern(id)
+        self.criterion_id = sys.intern(criterion_id)
+        self.name = name
+        self.order = order
+
+    def as_dict(self):
+        return {"id": self.id, "criterion_id": self.criterion_id, "name": self.name, "order": self.order}
+
+
+class Report:
+    __slots__ = ("id", "subcategory_id", "name", "order")
+
+    def __init__(self, id, subcategory_id, name, order):
+        self.id = sys.intern(id)
+        self.subcategory_id = sys.intern(subcategory_id)
+        self.name = name
+        self.order = order
+
+    def as_dict(self):
+        return {"id": self.id, "subcategory_id": self.subcategory_id, "name": self.name, "order": self.order}
+
+
+def _records(cls, rows, section):
+    if not isinstance(rows, list):
+        raise CatalogError(f"{section} must be a list, got {type(rows).__name__}")
+    records = []
+    for i, row in enumerate(rows):
+        if not isinstance(row, dict):
+            raise CatalogError(f"{section}[{i}] must be an object, got {type(row).__name__}")
+        try:
+            record = cls(**row)
+        except TypeError as e:
+            raise CatalogError(f"{section}[{i}]: {e}")
+        if not isinstance(record.name, str) or not isinstance(record.order, int):
+            raise CatalogError(f"{section}[{i}]: invalid name or order")
+        records.append(record)
+    return tuple(records)
+
+
+def _index(records, section):
+    by_id = {}
+    for record in records:
+        if record.id in by_id:
+            raise CatalogError(f"{section}: duplicate id {record.id}")
+        by_id[record.id] = record
+    return by_id
+
+
+# ---------- الكتالوج ----------
+class Catalog:
+    """نسخة غير قابلة للتعديل من الكتالوج مع فهارسها"""
+
+    def __init__(self, data: dict):
+        if not isinstance(data, dict):
+            raise CatalogError(f"catalog must be a JSON object, got {type(data).__name__}")
+        if data.get("schema") != SCHEMA_VERSION:
+            raise CatalogError(f"unsupported catalog schema {data.get('schema')!r}")
+
+        self.criteria = _records(Criterion, data.get("criteria", []), "criteria")
+        self.subcategories = _records(Subcategory, data.get("subcategories", []), "subcategories")
+        self.reports = _records(Report, data.get("reports", []), "reports")
+
+        self.criteria_by_id = _index(self.criteria, "criteria")
+        self.subcategories_by_id = _index(self.subcategories, "subcategories")
+        self.reports_by_id = _index(self.reports, "reports")
+
+        # التحقق من سلامة المراجع وبناء قوائم الأبناء
+        subcategories_of = {c.id: [] for c in self.criteria}
+        for s in self.subcategories:
+            if s.criterion_id not in subcategories_of:
+                raise CatalogError(f"subcategory {s.id}: unknown criterion {s.criterion_id}")
+            subcategories_of[s.criterion_id].append(s)
+        reports_of = {s.id: [] for s in self.subcategories}
+        for r in self.reports:
+            if r.subcategory_id not in reports_of:
+                raise CatalogError(f"report {r.id}: unknown subcategory {r.subcategory_id}")
+            reports_of[r.subcategory_id].append(r)
+        self.subcategories_of = {k: tuple(v) for k, v in subcategories_of.items()}
+        self.reports_of = {k: tuple(v) for k, v in reports_of.items()}
+
+        lookups = data.get("lookups", {})
+        if not isinstance(lookups, dict):
+            raise CatalogError(f"lookups must be an object, got {type(lookups).__name__}")
+        missing = [name for name in LOOKUP_NAMES if name not in lookups]
+        if missing:
+            raise CatalogError(f"missing lookup lists: {', '.join(missing)}")
+        for name in LOOKUP_NAMES:
+            values = lookups[name]
+            if not isinstance(values, list) or not all(isinstance(v, str) for v in values):
+                raise CatalogError(f"lookups.{name} must be a list of strings")
+        self.lookups = {name: tuple(lookups[name]) for name in LOOKUP_NAMES}
+
+        # بصمة محتوى لكل عنصر، ورقم النسخة بصمة لمجموعها
+        self.hashes = {
+            "criteria": {c.id: _digest(c.as_dict()) for c in self.criteria},
+            "subcategories": {s.id: _digest(s.as_dict()) for s in self.subcategories},
+            "reports": {r.id: _digest(r.as_dict()) for r in self.reports},
+            "lookups": {name: _digest(self.lookups[name]) for name in LOOKUP_NAMES},
+        }
+        self.version = _digest(self.hashes)
+
+        self.search_index = ReportIndex(
+            ((r, self.subcategories_by_id[r.subcategory_id].criterion_id) for r in self.reports),
+            extra_names=[s.name for s in self.subcategories] + [c.name for c in self.criteria]
+        )
+
+        # استجابات جاهزة التسلسل تُبنى مع النسخة وخارج مسار الطلبات
+        self.payloads = {
+            "criteria": dumps({"criteria": [c.as_dict() for c in self.criteria]}),
+            "full_structure": dumps({"structure": self.full_structure()}),
+        }
+        for name in LOOKUP_NAMES:
+            self.payloads[name] = dumps(list(self.lookups[name]))
+
+        self._related = None
+        self._related_lock = threading.Lock()
+
+    def criterion(self, criterion_id: str):
+        return self.criteria_by_id.get(criterion_id)
+
+    def subcategory(self, subcategory_id: str):
+        return self.subcategories_by_id.get(subcategory_id)
+
+    def report(self, report_id: str):
+        return self.reports_by_id.get(report_id)
+
+    def parents(self, report):
+        """التصنيف الفرعي والمعيار لتقرير معين"""
+        subcategory = self.subcategories_by_id[report.subcategory_id]
+        return subcategory, self.criteria_by_id[subcategory.criterion_id]
+
+    def related_index(self):
+        """جدول التقارير المتشابهة، يُبنى عند أول طلب لكل نسخة"""
+        if self._related is None:
+            with self._related_lock:
+                if self._related is None:
+                    from related import RelatedIndex
+                    self._related = RelatedIndex(self.reports)
+        return self._related
+
+    def entity(self, section: str, key: str):
+        if section == "lookups":
+            return {"name": key, "values": list(self.lookups[key])}
+        by_id = {
+            "criteria": self.criteria_by_id,
+            "subcategories": self.subcategories_by_id,
+            "reports": self.reports_by_id,
+        }[section]
+        return by_id[key].as_dict()
+
+    def changes_since(self, old_hashes: dict) -> dict:
+        """العناصر المضافة والمعدلة والمحذوفة مقارنة ببصمات نسخة سابقة"""
+        changes = {}
+        for section, current in self.hashes.items():
+            old = old_hashes[section]
+            added = [self.entity(section, k) for k in current if k not in old]
+            modified = [self.entity(section, k) for k, h in current.items() if k in old and old[k] != h]
+            removed = [k for k in old if k not in current]
+            if added or modified or removed:
+                changes[section] = {"added": added, "modified": modified, "removed": removed}
+        return changes
+
+    def full_structure(self):
+        """الهيكل الكامل (معايير + تصنيفات فرعية + تقارير)"""
+        result = []
+        for criterion in self.criteria:
+            criterion_data = criterion.as_dict()
+            criterion_data["subcategories"] = []
+            for subcategory in self.subcategories_of[criterion.id]:
+                subcategory_data = subcategory.as_dict()
+                subcategory_data["reports"] = [r.as_dict() for r in self.reports_of[subcategory.id]]
+                criterion_data["subcategories"].append(subcategory_data)
+            result.append(criterion_data)
+        return result
+
+
+def load_catalog(path: str = CATALOG_PATH) -> Catalog:
+    raw = Path(path).read_bytes()
+    try:
+        data = json.loads(raw)
+    except ValueError as e:
+        raise CatalogError(f"{path}: {e}")
+    return Catalog(data)
+
+
+_catalog = None
+_lock = threading.Lock()
+# بصمات النسخ السابقة التي رآها هذا العامل، لحساب الفروقات؛
+# وتُنشر في جدول catalog_versions ليحسبها أي عامل حتى لو لم يحمّل تلك النسخة
+_history: "OrderedDict[str, dict]" = OrderedDict()
+
+
+def get_catalog() -> Catalog:
+    """النسخة الحالية من الكتالوج؛ تُحمّل عند أول استخدام"""
+    if _catalog is None:
+        with _lock:
+            if _catalog is None:
+                _swap(load_catalog())
+    return _catalog
+
+
+def _swap(catalog: Catalog):
+    global _catalog
+    _history[catalog.version] = catalog.hashes
+    _history.move_to_end(catalog.version)
+    while len(_history) > HISTORY_SIZE:
+        _history.popitem(last=False)
+    _catalog = catalog
+    _publish(catalog)
+
+
+def _publish(catalog: Catalog):
+    try:
+        conn = get_connection()
+        cur = conn.cursor()
+        cur.execute("""
+            INSERT INTO catalog_versions (version, hashes, loaded_at) VALUES (?, ?, ?)
+            ON CONFLICT(version) DO UPDATE SET loaded_at = excluded.loaded_at
+        """, (catalog.version, json.dumps(catalog.hashes, ensure_ascii=False), time.time()))
+        cur.execute("""
+            DELETE FROM catalog_versions WHERE version NOT IN (
+                SELECT version FROM catalog_versions ORDER BY loaded_at DESC LIMIT ?
+            )
+        """, (HISTORY_SIZE,))
+        conn.commit()
+        conn.close()
+    except sqlite3.Error as e:
+        # الفروقات تبقى متاحة من ذاكرة هذا العامل
+        logger.warning("could not publish catalog version %s: %s", catalog.version, e)
+
+
+def _published_hashes(version: str):
+    conn = get_connection()
+    cur = conn.cursor()
+    cur.execute("SELECT hashes FROM catalog_versions WHERE version = ?", (version,))
+    row = cur.fetchone()
+    conn.close()
+    return json.loads(row[0]) if row else None
+
+
+def catalog_changes(catalog: Catalog, since: str):
+    """الفروقات منذ نسخة سابقة، أو None إذا لم تعد النسخة معروفة"""
+    old_hashes = _history.get(since)
+    if old_hashes is None:
+        old_hashes = _published_hashes(since)
+    if old_hashes is None:
+        return None
+    return catalog.changes_since(old_hashes)
+
+
+def reload_catalog(path: str = CATALOG_PATH):
+    """بناء نسخة جديدة والتحقق منها ثم استبدالها ذرياً؛ يعيد (النسخة السابقة، الحالية)"""
+    with _lock:
+        previous = _catalog
+        catalog = load_catalog(path)
+        if previous is not None and previous.version == catalog.version:
+            return previous, previous
+        _swap(catalog)
+    logger.info("catalog reloaded: %s -> %s", previous and previous.version, catalog.version)
+    return previous, catalog
+
+
+def watch_catalog(stop: threading.Event, interval: float, path: str = CATALOG_PATH):
+    """إعادة التحميل تلقائياً عند تغيّر ملف الكتالوج"""
+    try:
+        last = os.stat(path).st_mtime_ns
+    except OSError:
+        last = None
+    while not stop.wait(interval):
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            continue
+        if last is not None and mtime != last:
+            try:
+                reload_catalog(path)
+            except (OSError, CatalogError) as e:
+                logger.error("catalog reload failed, keeping %s: %s", _catalog and _catalog.version, e)
+            except Exception:
+                # خطأ غير متوقع لا يوقف المراقبة، وإلا لن يلتقط هذا العامل أي تعديل لاحق
+                logger.exception("catalog reload failed, keeping %s", _catalog and _catalog.version)
+        last = mtime
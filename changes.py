@@ -0,0 +1,145 @@
+# changes.py
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Set, Tuple
+
+import database
+from database import get_connection
+from metrics import db_timer
+
+CHANGES_KEEP = int(os.getenv("CHANGES_KEEP", "50000"))
+CHANGES_PAGE = 1000
+
+CODE_COLUMNS = "id, code, is_active, expires_at, usage_limit, usage_count"
+
+
+def code_to_dict(r, now: datetime) -> dict:
+    expired = False
+    if r[3] and datetime.fromisoformat(r[3]) < now:
+        expired = True
+    if r[4] is not None and r[5] >= r[4]:
+        expired = True
+
+    return {
+        "id": r[0],
+        "code": r[1],
+        "active": bool(r[2]),
+        "expires_at": r[3],
+        "usage_limit": r[4],
+        "usage_count": r[5],
+        "expired": expired
+    }
+
+
+def record_change(cur, code_id: int, op: str) -> int:
+    """تسجيل تغيير على كود ضمن نفس المعاملة؛ يعيد رقم التسلسل الجديد"""
+    cur.execute(
+        "INSERT INTO code_changes (code_id, op, changed_at) VALUES (?, ?, ?)",
+        (code_id, op, datetime.utcnow().isoformat())
+    )
+    seq = cur.lastrowid
+    if seq % 1000 == 0:
+        cur.execute("DELETE FROM code_changes WHERE seq <= ?", (seq - CHANGES_KEEP,))
+    return seq
+
+
+def record_changes(cur, code_ids, op: str):
+    """تسجيل تغيير واحد لكل كود في قائمة، ضمن نفس المعاملة"""
+    now = datetime.utcnow().isoformat()
+    cur.executemany(
+        "INSERT INTO code_changes (code_id, op, changed_at) VALUES (?, ?, ?)",
+        [(code_id, op, now) for code_id in code_ids]
+    )
+    seq = current_seq(cur)
+    cur.execute("DELETE FROM code_changes WHERE seq <= ?", (seq - CHANGES_KEEP,))
+
+
+def current_seq(cur) -> int:
+    cur.execute("SELECT COALESCE(MAX(seq), 0) FROM code_changes")
+    return cur.fetchone()[0]
+
+
+@db_timer("admin")
+def fetch_changes(since: int) -> dict:
+    """التغييرات بعد since مع الحالة الحالية لكل كود متغير (null للمحذوف)"""
+    conn = get_connection()
+    cur = conn.cursor()
+
+    cur.execute("SELECT MIN(seq), COALESCE(MAX(seq), 0) FROM code_changes")
+    oldest, newest = cur.fetchone()
+    if since > newest or (oldest is not None and since < oldest - 1):
+        # التغييرات المطلوبة حُذفت من السجل، أو المؤشر أحدث من القاعدة (مستعادة من نسخة)
+        # فلن يطابق أي تغيير قادم؛ على العميل إعادة التحميل الكامل
+        conn.close()
+        return {"seq": newest, "reset": True, "more": False, "changes": []}
+
+    cur.execute("""
+        SELECT code_id, MAX(seq)
+        FROM code_changes
+        WHERE seq > ?
+        GROUP BY code_id
+        ORDER BY MAX(seq)
+        LIMIT ?
+    """, (since, CHANGES_PAGE + 1))
+    changed = cur.fetchall()
+    more = len(changed) > CHANGES_PAGE
+    changed = changed[:CHANGES_PAGE]
+    if not changed:
+        conn.close()
+        return {"seq": since, "reset": False, "more": False, "changes": []}
+
+    ids = [code_id for code_id, _ in changed]
+    placeholders = ",".join("?" * len(ids))
+    cur.execute(f"SELECT {CODE_COLUMNS} FROM activation_codes WHERE id IN ({placeholders})", ids)
+    now = datetime.utcnow()
+    rows = {r[0]: code_to_dict(r, now) for r in cur.fetchall()}
+    conn.close()
+
+    return {
+        "seq": changed[-1][1],
+        "reset": False,
+        "more": more,
+        "changes": [{"id": code_id, "seq": seq, "code": rows.get(code_id)} for code_id, seq in changed]
+    }
+
+
+class ChangeWatcher:
+    """يكشف تغييرات الأكواد من أي عامل: PRAGMA data_version يتغير عند أي commit
+    من اتصال آخر، وعندها فقط يُقرأ ما أُضيف إلى code_changes بعد آخر رقم تسلسل"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.pid = None
+        self.conn = None
+        self.version = None
+        self.seq = 0
+
+    def poll(self) -> Tuple[bool, Set[int]]:
+        """(reset، معرفات الأكواد المتغيرة)؛ reset يعني إسقاط كل ما هو مخزّن"""
+        with self.lock:
+            if self.pid != os.getpid():
+                # اتصال SQLite لا يُستخدم بعد fork؛ العامل الجديد يبدأ بذاكرة فارغة
+                self.conn = sqlite3.connect(database.DB_PATH, check_same_thread=False)
+                self.pid = os.getpid()
+                self.version = self.conn.execute("PRAGMA data_version").fetchone()[0]
+                self.seq = current_seq(self.conn.cursor())
+                return True, set()
+
+            version = self.conn.execute("PRAGMA data_version").fetchone()[0]
+            if version == self.version:
+                return False, set()
+            self.version = version
+
+            cur = self.conn.cursor()
+            cur.execute("SELECT MIN(seq), COALESCE(MAX(seq), 0) FROM code_changes")
+            oldest, newest = cur.fetchone()
+            if newest < self.seq or (oldest is not None and self.seq < oldest - 1):
+                # قاعدة مستعادة من نسخة أو سجل محذوف جزئياً
+                self.seq = newest
+                return True, set()
+            cur.execute("SELECT code_id FROM code_changes WHERE seq > ? AND seq <= ?", (self.seq, newest))
+            changed = {row[0] for row in cur.fetchall()}
+            self.seq = newest
+            return False, changed
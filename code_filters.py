@@ -0,0 +1,37 @@
+# code_filters.py
+from datetime import datetime
+from typing import Optional
+
+# الحالة بالأولوية: موقوف ثم منتهي ثم مستنفد ثم فعّال
+_EXPIRED = "COALESCE(expires_at < :now, 0)"
+_EXHAUSTED = "(usage_limit IS NOT NULL AND usage_count >= usage_limit)"
+STATUS_CONDITIONS = {
+    "disabled": "is_active = 0",
+    "expired": f"is_active != 0 AND {_EXPIRED}",
+    "exhausted": f"is_active != 0 AND NOT {_EXPIRED} AND {_EXHAUSTED}",
+    "active": f"is_active != 0 AND NOT {_EXPIRED} AND NOT {_EXHAUSTED}",
+}
+STATUSES = tuple(STATUS_CONDITIONS)
+
+
+def build_filter(
+    status: Optional[str] = None,
+    plan: Optional[str] = None,
+    created_from: Optional[str] = None,
+    created_to: Optional[str] = None,
+):
+    """شرط WHERE ومعاملاته لتصفية الأكواد؛ الشرط فارغ عند عدم تحديد أي قيد"""
+    clauses = []
+    params = {"now": datetime.utcnow().isoformat()}
+    if status is not None:
+        clauses.append(f"({STATUS_CONDITIONS[status]})")
+    if plan is not None:
+        clauses.append("plan = :plan")
+        params["plan"] = plan
+    if created_from is not None:
+        clauses.append("created_at >= :created_from")
+        params["created_from"] = created_from
+    if created_to is not None:
+        clauses.append("created_at < :created_to")
+        params["created_to"] = created_to
+    return " AND ".join(clauses), params
@@ -1,9 +1,12 @@
 # create_key.py
 import uuid
 from database import get_connection
+from changes import record_change
+from metrics import db_timer
 from datetime import datetime
 
-def create_key(expires_at=None, usage_limit=None):
+@db_timer("admin")
+def create_key(expires_at=None, usage_limit=None, plan=None):
     code = str(uuid.uuid4()).upper().replace("-", "")[:16]
 
     conn = get_connection()
@@ -11,16 +14,18 @@ def create_key(expires_at=None, usage_limit=None):
     cur.execute(
         """
         INSERT INTO activation_codes
-        (code, is_active, created_at, expires_at, usage_limit, usage_count)
-        VALUES (?, 1, ?, ?, ?, 0)
+        (code, is_active, created_at, expires_at, usage_limit, usage_count, plan)
+        VALUES (?, 1, ?, ?, ?, 0, ?)
         """,
         (
             code,
             datetime.utcnow().isoformat(),
             expires_at,
-            usage_limit
+            usage_limit,
+            plan
         )
     )
+    record_change(cur, cur.lastrowid, "create")
     conn.commit()
     conn.close()
     return code
\ No newline at end of file
@@ -1,17 +1,59 @@
 # database.py
 import sqlite3
 import os
+import queue
 from datetime import datetime
 
-DB_PATH = "/tmp/database.db"
+DB_PATH = os.getenv("DB_PATH", "/tmp/database.db")
+POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "8"))
+
+_pool = queue.LifoQueue(maxsize=POOL_SIZE)
+
+class PooledConnection(sqlite3.Connection):
+    """اتصال يعود إلى مجمّع العامل عند close() بدلاً من إغلاقه"""
+    pooled = False
+
+    def close(self):
+        if self.pooled:
+            return
+        if self.in_transaction:
+            self.rollback()
+        try:
+            self.pooled = True
+            _pool.put_nowait(self)
+        except queue.Full:
+            self.pooled = False
+            super().close()
 
 def get_connection():
-    return sqlite3.connect(DB_PATH, check_same_thread=False)
+    try:
+        conn = _pool.get_nowait()
+        conn.pooled = False
+        return conn
+    except queue.Empty:
+        conn = sqlite3.connect(DB_PATH, check_same_thread=False, factory=PooledConnection)
+        # آمن مع WAL ويجنّب fsync عند كل commit
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+def reset_pool(close: bool = True):
+    """تفريغ المجمّع؛ اتصالات SQLite لا تُشارك بين العمليات بعد fork"""
+    global _pool
+    old, _pool = _pool, queue.LifoQueue(maxsize=POOL_SIZE)
+    while close:
+        try:
+            sqlite3.Connection.close(old.get_nowait())
+        except queue.Empty:
+            break
 
 def init_db():
-    os.makedirs("/tmp", exist_ok=True)
+    directory = os.path.dirname(DB_PATH)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
     conn = get_connection()
     cur = conn.cursor()
+    # القرّاء (ومنهم النسخ الاحتياطي) لا يوقفون الكتّاب في وضع WAL
+    cur.execute("PRAGMA journal_mode=WAL")
     cur.execute("""
     CREATE TABLE IF NOT EXISTS activation_codes (
         id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -24,5 +66,76 @@ def init_db():
         last_used_at TEXT
     )
     """)
+
+    columns = [row[1] for row in cur.execute("PRAGMA table_info(activation_codes)")]
+    if "plan" not in columns:
+        cur.execute("ALTER TABLE activation_codes ADD COLUMN plan TEXT")
+
+    cur.execute("""
+    CREATE TABLE IF NOT EXISTS code_changes (
+        seq INTEGER PRIMARY KEY AUTOINCREMENT,
+        code_id INTEGER,
+        op TEXT,
+        changed_at TEXT
+    )
+    """)
+
+    cur.execute("""
+    CREATE TABLE IF NOT EXISTS rate_limits (
+        key TEXT PRIMARY KEY,
+        tokens REAL,
+        updated_at REAL,
+        allowed INTEGER,
+        full_at REAL
+    )
+    """)
+
+    columns = [row[1] for row in cur.execute("PRAGMA table_info(rate_limits)")]
+    if "full_at" not in columns:
+        cur.execute("ALTER TABLE rate_limits ADD COLUMN full_at REAL")
+
+    cur.execute("""
+    CREATE TABLE IF NOT EXISTS report_history (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        code_id INTEGER,
+        report_id TEXT,
+        report_name TEXT,
+        subcategory_name TEXT,
+        criterion_name TEXT,
+        report_data TEXT,
+        fields TEXT,
+        content TEXT,
+        catalog_version TEXT,
+        created_at TEXT
+    )
+    """)
+
+    cur.execute("""
+    CREATE TABLE IF NOT EXISTS idempotency_keys (
+        key TEXT PRIMARY KEY,
+        token TEXT,
+        fingerprint TEXT,
+        state TEXT,
+        status INTEGER,
+        body BLOB,
+        expires_at REAL
+    )
+    """)
+
+    cur.execute("""
+    CREATE TABLE IF NOT EXISTS catalog_versions (
+        version TEXT PRIMARY KEY,
+        hashes TEXT,
+        loaded_at REAL
+    )
+    """)
+
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_codes_expires_at ON activation_codes (expires_at)")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_codes_created_at ON activation_codes (created_at, plan)")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_codes_last_used_at ON activation_codes (last_used_at)")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_codes_plan ON activation_codes (plan, created_at)")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_rate_limits_full_at ON rate_limits (full_at)")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_history_code ON report_history (code_id, id)")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_idempotency_expires_at ON idempotency_keys (expires_at)")
     conn.commit()
     conn.close()
\ No newline at end of file
@@ -0,0 +1,26 @@
+# fast_json.py
+import json
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def dumps(content: Any) -> bytes:
+    """تسلسل JSON بترميز UTF-8 مباشرة (دون \\u للحروف العربية)"""
+    if orjson is not None:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(
+        content, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """استجابة JSON تستخدم orjson عند توفره وإلا json القياسية"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
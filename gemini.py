@@ -0,0 +1,207 @@
+# gemini.py
+import os
+import math
+import random
+import itertools
+import threading
+import time
+
+from fastapi import HTTPException
+
+from breaker import STATE_VALUES, CircuitBreaker
+from metrics import (
+    GEMINI_BREAKER_STATE, GEMINI_ERRORS, GEMINI_FAST_FAIL, GEMINI_IN_FLIGHT, GEMINI_LATENCY, GEMINI_RETRIES
+)
+from timing import annotate, span
+
+GEMINI_MODEL = "models/gemini-2.5-flash-lite"
+GEMINI_WARMUP = os.getenv("GEMINI_WARMUP", "1") == "1"
+
+# إعادة المحاولة بمفتاح آخر ضمن مهلة إجمالية للطلب
+GEMINI_MAX_ATTEMPTS = int(os.getenv("GEMINI_MAX_ATTEMPTS", "3"))
+GEMINI_DEADLINE = float(os.getenv("GEMINI_DEADLINE", "90"))
+GEMINI_BACKOFF_BASE = float(os.getenv("GEMINI_BACKOFF_BASE", "0.5"))
+GEMINI_BACKOFF_CAP = float(os.getenv("GEMINI_BACKOFF_CAP", "4"))
+# أقل وقت متبقٍ يستحق بدء محاولة جديدة
+GEMINI_MIN_ATTEMPT_SECONDS = 2
+
+# ---------- Gemini Keys ----------
+api_keys = [
+    os.getenv("GEMINI_API_KEY_1"),
+    os.getenv("GEMINI_API_KEY_2"),
+    os.getenv("GEMINI_API_KEY_3"),
+    os.getenv("GEMINI_API_KEY_4"),
+    os.getenv("GEMINI_API_KEY_5"),
+    os.getenv("GEMINI_API_KEY_6"),
+    os.getenv("GEMINI_API_KEY_7"),
+]
+api_keys = [k for k in api_keys if k]
+key_cycle = itertools.cycle(range(len(api_keys))) if api_keys else None
+
+# ---------- Circuit breakers ----------
+# قاطع لكل مفتاح (مفتاح مستنفد أو ملغى) وقاطع عام (تعطل Gemini نفسه)
+def _breaker_changed(breaker, state):
+    GEMINI_BREAKER_STATE.labels(breaker.name).set(STATE_VALUES[state])
+
+global_breaker = CircuitBreaker("global")
+key_breakers = [CircuitBreaker(f"key{i + 1}") for i in range(len(api_keys))]
+for _breaker in [global_breaker] + key_breakers:
+    _breaker.on_change = _breaker_changed
+
+def failure_scope(e: Exception):
+    """"key" لأخطاء تخص المفتاح (حصة مستنفدة، مفتاح ملغى)، "upstream" لتعطل Gemini أو الشبكة،
+    و None لأخطاء الطلب نفسه (400، محتوى محجوب) التي لا تُحتسب على أي قاطع"""
+    code = getattr(e, "code", None)
+    if isinstance(code, int):
+        if code in (401, 403, 429):
+            return "key"
+        if code == 408 or code >= 500:
+            return "upstream"
+        return None
+    if isinstance(e, ValueError):
+        return None
+    return "upstream"
+
+def _unavailable(retry_after: float):
+    raise HTTPException(
+        status_code=503,
+        detail="خدمة التوليد غير متاحة مؤقتاً، حاول مرة أخرى بعد قليل",
+        headers={"Retry-After": str(max(1, math.ceil(retry_after)))}
+    )
+
+def get_api_key(tried=()):
+    """المفتاح التالي في الدورة الذي يسمح قاطعه، مع رقمه (يُستخدم في المقاييس بدلاً من المفتاح)؛
+    يُفضَّل مفتاح لم يُجرَّب في هذا الطلب، ثم أي مفتاح متاح"""
+    if not key_cycle:
+        raise HTTPException(status_code=500, detail="No Gemini API key configured")
+    # الدورة تتقدم مرة واحدة لكل طلب فتتوزع الطلبات على المفاتيح، ثم تُمسح المفاتيح من تلك النقطة
+    start = next(key_cycle)
+    order = [(start + i) % len(api_keys) for i in range(len(api_keys))]
+    for index in [i for i in order if i not in tried] + [i for i in order if i in tried]:
+        if key_breakers[index].allow():
+            return index, api_keys[index]
+    return None
+
+def breaker_status() -> dict:
+    return {
+        "global": global_breaker.snapshot(),
+        "keys": [b.snapshot() for b in key_breakers]
+    }
+
+def reset_breakers():
+    for breaker in [global_breaker] + key_breakers:
+        breaker.reset()
+
+# ---------- SDK ----------
+def sdk():
+    """استيراد google.generativeai عند أول حاجة إليه فقط؛ يسحب gRPC وprotobuf"""
+    import google.generativeai as genai
+    return genai
+
+def warm_up():
+    """استيراد الـ SDK في خيط خلفي حتى لا ينتظره أول طلب توليد"""
+    threading.Thread(target=sdk, name="gemini-warmup", daemon=True).start()
+
+# عميل لكل مفتاح؛ genai.configure عام للعملية، فالطلبات المتزامنة كانت تستبدل مفاتيح بعضها
+# بين configure والاستدعاء وتُسجَّل الأخطاء على قاطع مفتاح غير الذي استُخدم فعلاً
+_clients = {}
+_clients_lock = threading.Lock()
+
+def client_for(index: int):
+    client = _clients.get(index)
+    if client is None:
+        with _clients_lock:
+            client = _clients.get(index)
+            if client is None:
+                sdk()
+                from google.ai import generativelanguage as glm
+                client = glm.GenerativeServiceClient(client_options={"api_key": api_keys[index]})
+                _clients[index] = client
+    return client
+
+def _call(index: int, prompt: str, timeout: float) -> str:
+    """استدعاء واحد لـ Gemini بعميل المفتاح مع تسجيل نتيجته في المقاييس والقواطع"""
+    with span("sdk"):
+        genai = sdk()
+        client = client_for(index)
+    request = genai.protos.GenerateContentRequest(
+        model=GEMINI_MODEL,
+        contents=[genai.protos.Content(role="user", parts=[genai.protos.Part(text=prompt)])]
+    )
+
+    key = str(index + 1)
+    annotate(key=index + 1)
+    start = time.perf_counter()
+    scope = "upstream"
+    GEMINI_IN_FLIGHT.inc()
+    try:
+        with span("gemini"):
+            # retry=None: إعادة المحاولة الافتراضية في العميل تكرر 503 على نفس المفتاح متجاوزةً
+            # المهلة والقواطع، فحلقة generate وحدها تعيد المحاولة
+            response = client.generate_content(request, retry=None, timeout=timeout)
+            # text ترفع ValueError إن حُجب الرد، كما في GenerativeModel
+            text = genai.types.GenerateContentResponse.from_response(response).text
+        scope = None
+        return text
+    except Exception as e:
+        scope = failure_scope(e)
+        GEMINI_ERRORS.labels(key, type(e).__name__).inc()
+        raise
+    finally:
+        duration = time.perf_counter() - start
+        GEMINI_IN_FLIGHT.dec()
+        GEMINI_LATENCY.labels(key).observe(duration)
+        key_breakers[index].record(scope is None, duration)
+        if scope == "key":
+            # مفتاح واحد مستنفد لا يعني تعطل الخدمة
+            global_breaker.release()
+        else:
+            global_breaker.record(scope is None, duration)
+
+def generate(prompt: str) -> str:
+    """توليد نص مع إعادة المحاولة بمفتاح آخر عند الأخطاء العابرة (429، 5xx، الشبكة)
+    وانتظار عشوائي متزايد، دون تجاوز GEMINI_DEADLINE؛ 503 فوراً إن كانت القواطع مفتوحة"""
+    deadline = time.monotonic() + GEMINI_DEADLINE
+    tried = set()
+    attempts = 0
+    last_scope = None
+    while attempts < GEMINI_MAX_ATTEMPTS:
+        if attempts:
+            if last_scope == "key" and len(tried) == len(api_keys):
+                # كل المفاتيح رفضت الطلب؛ تكرارها فوراً يزيد استهلاك الحصة فقط
+                break
+            # مفتاح مستنفد يُستبدل فوراً؛ الانتظار فقط عندما يكون Gemini نفسه متعثراً
+            delay = 0.0
+            if last_scope == "upstream":
+                delay = random.uniform(0, min(GEMINI_BACKOFF_CAP, GEMINI_BACKOFF_BASE * 2 ** (attempts - 1)))
+            if deadline - time.monotonic() - delay < GEMINI_MIN_ATTEMPT_SECONDS:
+                break
+            if delay:
+                with span("backoff"):
+                    time.sleep(delay)
+
+        if not global_breaker.allow():
+            if not attempts:
+                GEMINI_FAST_FAIL.inc()
+            _unavailable(global_breaker.retry_after())
+        picked = get_api_key(tried)
+        if picked is None:
+            global_breaker.release()
+            if not attempts:
+                GEMINI_FAST_FAIL.inc()
+            _unavailable(min(b.retry_after() for b in key_breakers))
+
+        index, _ = picked
+        tried.add(index)
+        attempts += 1
+        annotate(attempts=attempts)
+        try:
+            return _call(index, prompt, deadline - time.monotonic())
+        except Exception as e:
+            last_scope = failure_scope(e)
+            if last_scope is None:
+                # خطأ في الطلب نفسه؛ إعادته بمفتاح آخر لن تغيّر النتيجة
+                raise
+            GEMINI_RETRIES.labels(last_scope).inc()
+
+    _unavailable(GEMINI_BACKOFF_CAP)
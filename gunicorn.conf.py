@@ -0,0 +1,66 @@
+# gunicorn.conf.py
+# التشغيل: gunicorn main:app
+import gc
+import os
+import shutil
+import multiprocessing
+
+import database
+
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+worker_class = "uvicorn.workers.UvicornWorker"
+
+# كل عامل غير متزامن ويشغّل استدعاءات Gemini في مجمّع خيوطه، فعامل لكل نواة يكفي
+workers = int(os.getenv("WEB_CONCURRENCY", max(2, multiprocessing.cpu_count())))
+
+# التوليد قد يستغرق عدة ثوانٍ؛ المهلة الرشيقة تسمح بإكمال الطلبات الجارية عند إعادة التشغيل
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "120"))
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", "90"))
+keepalive = 5
+
+# تحميل التطبيق في العملية الرئيسية مرة واحدة ومشاركته مع العمال (copy-on-write)
+preload_app = os.getenv("GUNICORN_PRELOAD", "1") == "1"
+
+accesslog = "-"
+
+# حد المعدل لكل IP يقرأ عنوان العميل من X-Forwarded-For، ولا يُوثق به إلا من هذه العناوين
+# (الوكيل العكسي للمنصة)؛ وإلا يتشارك كل المستخدمين خلف الوكيل دلواً واحداً
+forwarded_allow_ips = os.getenv(
+    "FORWARDED_ALLOW_IPS", "127.0.0.1,::1,10.0.0.0/8,172.16.0.0/12,192.168.0.0/16"
+)
+
+# مقاييس Prometheus المشتركة بين العمال؛ يجب ضبطه قبل تحميل التطبيق
+os.environ.setdefault("PROMETHEUS_MULTIPROC_DIR", "/tmp/prometheus_multiproc")
+os.makedirs(os.environ["PROMETHEUS_MULTIPROC_DIR"], exist_ok=True)
+
+
+def on_starting(server):
+    # ملفات المقاييس من تشغيل سابق تُحتسب وكأنها عمال أحياء
+    path = os.environ["PROMETHEUS_MULTIPROC_DIR"]
+    shutil.rmtree(path, ignore_errors=True)
+    os.makedirs(path, exist_ok=True)
+
+
+def when_ready(server):
+    if not preload_app:
+        return
+    from catalog import get_catalog
+
+    # بناء الكتالوج وفهارسه قبل fork ليشترك فيه كل العمال
+    get_catalog().related_index()
+    # لا يُورث أي اتصال SQLite للعمال
+    database.reset_pool()
+    # تجميد الكائنات الحالية حتى لا يلمس جامع القمامة صفحاتها في العمال فيُنسخها
+    gc.collect()
+    gc.freeze()
+
+
+def post_fork(server, worker):
+    # مجمّع اتصالات خاص بكل عامل
+    database.reset_pool(close=False)
+
+
+def child_exit(server, worker):
+    from prometheus_client import multiprocess
+
+    multiprocess.mark_process_dead(worker.pid)
@@ -0,0 +1,139 @@
+# history.py
+# سجل التقارير المولّدة لكل كود؛ يُعاد تنزيلها من القاعدة دون استدعاء Gemini
+import re
+import json
+from typing import List, Optional
+
+from database import get_connection
+from metrics import db_timer
+
+HISTORY_PAGE = 20
+HISTORY_MAX_PAGE = 100
+
+# بنفس ترتيب الحقول المطلوبة في البرومبت
+REPORT_FIELDS = (
+    "الهدف التربوي",
+    "نبذة مختصرة",
+    "إجراءات التنفيذ",
+    "الاستراتيجيات المستخدمة",
+    "نقاط القوة",
+    "نقاط التحسين",
+    "التوصيات",
+)
+
+# "1." أو "1-" أو "١)" أو "**1.**" في بداية السطر
+_FIELD_LINE = re.compile(r"^\s*[*#]*\s*([1-7١-٧])\s*[.)\-–:]\s*[*]*\s*(.*)$")
+_ARABIC_DIGITS = str.maketrans("١٢٣٤٥٦٧", "1234567")
+
+SUMMARY_COLUMNS = "id, report_id, report_name, subcategory_name, criterion_name, catalog_version, created_at"
+
+
+def parse_fields(content: str) -> List[str]:
+    """تقسيم رد النموذج إلى الحقول السبعة؛ الأسطر غير المرقمة تُلحق بالحقل السابق"""
+    fields = [[] for _ in REPORT_FIELDS]
+    current = None
+    for line in content.splitlines():
+        match = _FIELD_LINE.match(line)
+        if match:
+            current = int(match.group(1).translate(_ARABIC_DIGITS)) - 1
+            line = match.group(2)
+        if current is not None and line.strip():
+            fields[current].append(line.strip())
+    return [" ".join(parts) for parts in fields]
+
+
+def _summary(r) -> dict:
+    return {
+        "id": r[0],
+        "report_id": r[1],
+        "report_name": r[2],
+        "subcategory_name": r[3],
+        "criterion_name": r[4],
+        "catalog_version": r[5],
+        "created_at": r[6],
+    }
+
+
+@db_timer("history")
+def save_report(
+    code_id: int,
+    report_id: str,
+    report_name: str,
+    subcategory_name: str,
+    criterion_name: str,
+    report_data: dict,
+    content: str,
+    catalog_version: str,
+    created_at: str,
+) -> int:
+    conn = get_connection()
+    cur = conn.cursor()
+    cur.execute("""
+        INSERT INTO report_history (
+            code_id, report_id, report_name, subcategory_name, criterion_name,
+            report_data, fields, content, catalog_version, created_at
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """, (
+        code_id, report_id, report_name, subcategory_name, criterion_name,
+        json.dumps(report_data, ensure_ascii=False),
+        json.dumps(parse_fields(content), ensure_ascii=False),
+        content, catalog_version, created_at
+    ))
+    history_id = cur.lastrowid
+    conn.commit()
+    conn.close()
+    return history_id
+
+
+@db_timer("history")
+def list_reports(code_id: int, before: Optional[int] = None, limit: int = HISTORY_PAGE) -> dict:
+    """صفحة من تقارير الكود من الأحدث للأقدم؛ next_before هو مؤشر الصفحة التالية"""
+    conn = get_connection()
+    cur = conn.cursor()
+    cur.execute(f"""
+        SELECT {SUMMARY_COLUMNS}
+        FROM report_history
+        WHERE code_id = ? AND id < ?
+        ORDER BY id DESC
+        LIMIT ?
+    """, (code_id, before if before is not None else 2 ** 63 - 1, limit + 1))
+    rows = cur.fetchall()
+    conn.close()
+
+    more = len(rows) > limit
+    rows = rows[:limit]
+    return {
+        "items": [_summary(r) for r in rows],
+        "next_before": rows[-1][0] if more else None
+    }
+
+
+@db_timer("history")
+def load_report(code_id: int, history_id: int) -> Optional[dict]:
+    """تقرير واحد كاملاً إن كان يخص الكود"""
+    conn = get_connection()
+    cur = conn.cursor()
+    cur.execute(f"""
+        SELECT {SUMMARY_COLUMNS}, report_data, fields, content
+        FROM report_history
+        WHERE id = ? AND code_id = ?
+    """, (history_id, code_id))
+    r = cur.fetchone()
+    conn.close()
+    if not r:
+        return None
+
+    report = _summary(r)
+    report["report_data"] = json.loads(r[7])
+    report["fields"] = [
+        {"number": i + 1, "title": title, "content": text}
+        for i, (title, text) in enumerate(zip(REPORT_FIELDS, json.loads(r[8])))
+    ]
+    report["content"] = r[9]
+    return report
+
+
+def delete_history(cur, code_ids: List[int]):
+    """حذف سجل الأكواد المحذوفة ضمن نفس المعاملة"""
+    placeholders = ",".join("?" * len(code_ids))
+    cur.execute(f"DELETE FROM report_history WHERE code_id IN ({placeholders})", code_ids)
@@ -0,0 +1,162 @@
+# idempotency.py
+# ترويسة Idempotency-Key لمسارات التوليد: أول طلب يحجز المفتاح وتُحفظ استجابته
+# لمدة IDEMPOTENCY_TTL، والمكرر المتزامن ينتظره، والمكرر اللاحق يستلم الاستجابة
+# المحفوظة دون استدعاء Gemini ودون خصم استخدام. الجدول مشترك بين العمال
+import os
+import time
+import uuid
+import asyncio
+import hashlib
+from typing import Optional
+
+from fastapi import Depends, Header, HTTPException, Request
+from fastapi.concurrency import run_in_threadpool
+
+from database import get_connection
+from fast_json import dumps
+from gemini import GEMINI_DEADLINE
+from metrics import IDEMPOTENCY_RESULTS, db_timer
+from security import history_access
+
+IDEMPOTENCY_TTL = float(os.getenv("IDEMPOTENCY_TTL", str(24 * 3600)))
+# حجز المفتاح ينتهي إن مات العامل المالك قبل الإكمال، فيأخذه الطلب التالي
+IDEMPOTENCY_LEASE = float(os.getenv("IDEMPOTENCY_LEASE", str(GEMINI_DEADLINE + 30)))
+IDEMPOTENCY_POLL_INTERVAL = float(os.getenv("IDEMPOTENCY_POLL_INTERVAL", "0.25"))
+IDEMPOTENCY_KEY_MAX = 255
+PURGE_EVERY = 500
+
+
+class IdempotentReplay(Exception):
+    """استجابة محفوظة لطلب سابق بنفس المفتاح؛ تُرسل كما هي"""
+
+    def __init__(self, status_code: int, body: bytes):
+        self.status_code = status_code
+        self.body = body
+
+
+class Claim:
+    """حجز مفتاح لطلب واحد؛ save() تحفظ النتيجة، وإلا يُحرَّر المفتاح عند انتهاء الطلب"""
+
+    def __init__(self, key: str):
+        self.key = key
+        self.token = uuid.uuid4().hex
+        self.saved = False
+
+    @db_timer("idempotency")
+    def save(self, result, status_code: int = 200):
+        now = time.time()
+        conn = get_connection()
+        cur = conn.cursor()
+        cur.execute("""
+            UPDATE idempotency_keys
+            SET state = 'done', status = ?, body = ?, expires_at = ?
+            WHERE key = ? AND token = ?
+        """, (status_code, dumps(result), now + IDEMPOTENCY_TTL, self.key, self.token))
+        conn.commit()
+        conn.close()
+        self.saved = True
+
+    @db_timer("idempotency")
+    def release(self):
+        if self.saved:
+            return
+        conn = get_connection()
+        cur = conn.cursor()
+        cur.execute("DELETE FROM idempotency_keys WHERE key = ? AND token = ?", (self.key, self.token))
+        conn.commit()
+        conn.close()
+
+
+@db_timer("idempotency")
+def _try_claim(claim: Claim, fingerprint: str) -> Optional[tuple]:
+    """None إن حُجز المفتاح لهذا الطلب، وإلا (fingerprint, state, status, body) للصف الموجود"""
+    now = time.time()
+    params = {
+        "key": claim.key,
+        "token": claim.token,
+        "fingerprint": fingerprint,
+        "now": now,
+        "lease": now + IDEMPOTENCY_LEASE,
+    }
+    conn = get_connection()
+    cur = conn.cursor()
+    # الصف المنتهي أو المحجوز من عامل مات يُعاد استخدامه في نفس العبارة
+    cur.execute("""
+        INSERT INTO idempotency_keys (key, token, fingerprint, state, status, body, expires_at)
+        VALUES (:key, :token, :fingerprint, 'pending', NULL, NULL, :lease)
+        ON CONFLICT(key) DO UPDATE SET
+            token = excluded.token,
+            fingerprint = excluded.fingerprint,
+            state = 'pending',
+            status = NULL,
+            body = NULL,
+            expires_at = excluded.expires_at
+        WHERE expires_at < :now
+        RETURNING rowid
+    """, params)
+    row = cur.fetchone()
+    if row is None:
+        cur.execute(
+            "SELECT fingerprint, state, status, body FROM idempotency_keys WHERE key = ?",
+            (claim.key,)
+        )
+        existing = cur.fetchone()
+    else:
+        existing = None
+        if row[0] % PURGE_EVERY == 0:
+            cur.execute("DELETE FROM idempotency_keys WHERE expires_at < ?", (now,))
+    conn.commit()
+    conn.close()
+    return existing
+
+
+async def idempotency(
+    request: Request,
+    code_id: int = Depends(history_access),
+    idempotency_key: Optional[str] = Header(None, min_length=1, max_length=IDEMPOTENCY_KEY_MAX)
+):
+    """يُعلن قبل حد المعدل والتحقق من الرصيد، فإعادة آخر طلب لكود استنفد رصيده تستلم نتيجته"""
+    if idempotency_key is None:
+        yield None
+        return
+
+    fingerprint = hashlib.sha256(request.url.path.encode() + b"\0" + await request.body()).hexdigest()
+    claim = Claim(f"{code_id}:{request.url.path}:{idempotency_key}")
+    deadline = time.monotonic() + IDEMPOTENCY_LEASE
+    waited = False
+    while True:
+        existing = await run_in_threadpool(_try_claim, claim, fingerprint)
+        if existing is None:
+            break
+        stored_fingerprint, state, status, body = existing
+        if stored_fingerprint != fingerprint:
+            IDEMPOTENCY_RESULTS.labels("mismatch").inc()
+            raise HTTPException(
+                status_code=422,
+                detail="Idempotency-Key already used with a different request body"
+            )
+        if state == "done":
+            IDEMPOTENCY_RESULTS.labels("waited" if waited else "replayed").inc()
+            raise IdempotentReplay(status, body)
+        if time.monotonic() >= deadline:
+            IDEMPOTENCY_RESULTS.labels("in_progress").inc()
+            raise HTTPException(
+                status_code=409,
+                detail="A request with this Idempotency-Key is still in progress",
+                headers={"Retry-After": "1"}
+            )
+        # الطلب الأصلي ما زال يعمل؛ إن فشل يُحذف صفه فيحجزه هذا الطلب ويعيد المحاولة
+        waited = True
+        await asyncio.sleep(IDEMPOTENCY_POLL_INTERVAL)
+
+    try:
+        yield claim
+    finally:
+        await run_in_threadpool(claim.release)
+
+
+def remember(claim: Optional[Claim], result):
+    """حفظ نتيجة المسار لمفتاحه إن أُرسل مفتاح، ثم إرجاعها كما هي"""
+    if claim is not None:
+        claim.save(result)
+    return result
@@ -0,0 +1,165 @@
+# metrics.py
+# مقاييس بصيغة Prometheus؛ مع gunicorn يُضبط PROMETHEUS_MULTIPROC_DIR
+# فتكتب كل عملية قيمها في ملفات مشتركة وتُجمع عند /metrics
+import os
+import time
+import asyncio
+from contextlib import contextmanager
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Gauge, Histogram, generate_latest
+)
+
+METRICS_SAMPLE_INTERVAL = float(os.getenv("METRICS_SAMPLE_INTERVAL", "1"))
+
+DB_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5)
+GEMINI_BUCKETS = (0.25, 0.5, 1, 2, 4, 8, 15, 30, 60)
+
+# ---------- HTTP ----------
+HTTP_REQUESTS = Counter(
+    "http_requests_total", "HTTP requests by route template and status",
+    ["method", "route", "status"]
+)
+HTTP_LATENCY = Histogram(
+    "http_request_duration_seconds", "Time until the last response byte is sent",
+    ["method", "route"]
+)
+
+# ---------- SQLite ----------
+DB_LATENCY = Histogram(
+    "sqlite_query_duration_seconds", "SQLite time per query type (lookup, consume, history, idempotency, admin)",
+    ["kind"], buckets=DB_BUCKETS
+)
+
+# ---------- Gemini ----------
+GEMINI_LATENCY = Histogram(
+    "gemini_request_duration_seconds", "Gemini generate_content latency per API key index",
+    ["key"], buckets=GEMINI_BUCKETS
+)
+GEMINI_ERRORS = Counter(
+    "gemini_errors_total", "Failed Gemini calls per API key index and exception type",
+    ["key", "error"]
+)
+GEMINI_IN_FLIGHT = Gauge(
+    "gemini_in_flight", "Generations currently waiting on Gemini",
+    multiprocess_mode="livesum"
+)
+GEMINI_BREAKER_STATE = Gauge(
+    "gemini_breaker_state", "Circuit breaker state per breaker (0 closed, 1 half-open, 2 open)",
+    ["breaker"], multiprocess_mode="max"
+)
+GEMINI_RETRIES = Counter(
+    "gemini_retries_total", "Failed attempts followed by a retry or a final 503, by failure scope (key, upstream)",
+    ["scope"]
+)
+GEMINI_FAST_FAIL = Counter(
+    "gemini_fast_fail_total", "Generations rejected with 503 because breakers were open"
+)
+
+# ---------- Rate limits ----------
+RATE_LIMITED = Counter(
+    "rate_limited_total", "Requests rejected with 429 by limit scope (code, ip)",
+    ["scope"]
+)
+
+# ---------- Idempotency ----------
+IDEMPOTENCY_RESULTS = Counter(
+    "idempotency_results_total",
+    "Generation requests with a reused Idempotency-Key (replayed, waited, in_progress, mismatch)",
+    ["result"]
+)
+
+# ---------- Backups ----------
+BACKUP_LAST_SUCCESS = Gauge(
+    "backup_last_success_timestamp_seconds", "Unix time of the last successful database backup",
+    multiprocess_mode="max"
+)
+
+# ---------- Caches ----------
+CACHE_LOOKUPS = Counter(
+    "cache_lookups_total", "Cache lookups by cache name and result (hit/miss)",
+    ["cache", "result"]
+)
+
+# ---------- Threadpool ----------
+THREADPOOL_BUSY = Gauge(
+    "threadpool_busy_threads", "Worker threads running sync routes and dependencies",
+    multiprocess_mode="livesum"
+)
+THREADPOOL_QUEUED = Gauge(
+    "threadpool_queued_tasks", "Tasks waiting for a free worker thread",
+    multiprocess_mode="livesum"
+)
+THREADPOOL_SIZE = Gauge(
+    "threadpool_size", "Worker thread limit",
+    multiprocess_mode="livesum"
+)
+
+
+@contextmanager
+def db_timer(kind: str):
+    """قياس زمن عمل SQLite؛ يُستخدم مع with أو كمزخرف"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        DB_LATENCY.labels(kind).observe(time.perf_counter() - start)
+
+
+def cache_result(cache: str, hit: bool):
+    CACHE_LOOKUPS.labels(cache, "hit" if hit else "miss").inc()
+
+
+class MetricsMiddleware:
+    """عدّ الطلبات وزمنها حسب قالب المسار لا المسار الفعلي، لتبقى التسميات محدودة"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route = getattr(scope.get("route"), "path", "unmatched")
+            HTTP_REQUESTS.labels(scope["method"], route, str(status)).inc()
+            HTTP_LATENCY.labels(scope["method"], route).observe(time.perf_counter() - start)
+
+
+async def sample_threadpool(stop: asyncio.Event):
+    """قراءة حالة مجمّع خيوط AnyIO دورياً من حلقة الأحداث"""
+    from anyio.to_thread import current_default_thread_limiter
+
+    limiter = current_default_thread_limiter()
+    while not stop.is_set():
+        THREADPOOL_SIZE.set(limiter.total_tokens)
+        THREADPOOL_BUSY.set(limiter.borrowed_tokens)
+        THREADPOOL_QUEUED.set(limiter.statistics().tasks_waiting)
+        try:
+            await asyncio.wait_for(stop.wait(), METRICS_SAMPLE_INTERVAL)
+        except asyncio.TimeoutError:
+            pass
+
+
+def render() -> tuple:
+    """نص المقاييس ونوع المحتوى؛ في وضع تعدد العمليات تُجمع ملفات كل العمال"""
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
@@ -0,0 +1,67 @@
+# profiler.py
+# مُحلّل عيّنات بسيط بالمكتبة القياسية: يقرأ مكدّسات كل الخيوط دورياً
+# ويعيدها بصيغة collapsed stacks (flamegraph.pl / speedscope)
+import os
+import sys
+import time
+import threading
+from collections import Counter
+
+# دوال الانتظار التي تعني أن الخيط خامل (حلقة الأحداث أو خيط مجمّع بلا عمل)
+IDLE_FRAMES = {
+    ("selectors.py", "select"),
+    ("threading.py", "wait"),
+    ("threading.py", "_wait_for_tstate_lock"),
+    ("queue.py", "get"),
+}
+
+_session = threading.Lock()
+
+
+class ProfilerBusy(Exception):
+    pass
+
+
+def _label(code) -> str:
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+def _is_idle(frame) -> bool:
+    code = frame.f_code
+    return (os.path.basename(code.co_filename), code.co_name) in IDLE_FRAMES
+
+
+def sample(seconds: float, interval: float = 0.005, idle: bool = False) -> Counter:
+    """أخذ عيّنة من مكدّس كل خيط كل interval ثانية لمدة seconds؛ جلسة واحدة في كل عامل"""
+    if not _session.acquire(blocking=False):
+        raise ProfilerBusy()
+    try:
+        me = threading.get_ident()
+        stacks = Counter()
+        labels = {}
+        deadline = time.monotonic() + seconds
+        while time.monotonic() < deadline:
+            frames = sys._current_frames()
+            for ident, frame in frames.items():
+                if ident == me or (not idle and _is_idle(frame)):
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    label = labels.get(code)
+                    if label is None:
+                        label = labels[code] = _label(code)
+                    stack.append(label)
+                    frame = frame.f_back
+                stacks[";".join(reversed(stack))] += 1
+            # لا نُبقي مراجع للإطارات بين العيّنات
+            del frames
+            time.sleep(interval)
+        return stacks
+    finally:
+        _session.release()
+
+
+def collapsed(stacks: Counter) -> str:
+    """سطر لكل مكدّس: الإطارات من الجذر مفصولة بـ ; ثم عدد العيّنات"""
+    return "".join(f"{stack} {count}\n" for stack, count in stacks.most_common())
@@ -0,0 +1,42 @@
+# quota.py
+from datetime import datetime
+
+from database import get_connection
+from changes import record_change
+from metrics import db_timer
+
+
+@db_timer("consume")
+def consume_usage(code_id: int) -> bool:
+    """حجز استخدام واحد للكود إن بقي له رصيد؛ الشرط داخل UPDATE فلا تتجاوز الطلبات المتزامنة الحد"""
+    conn = get_connection()
+    cur = conn.cursor()
+    cur.execute("""
+        UPDATE activation_codes
+        SET usage_count = usage_count + 1,
+            last_used_at = ?
+        WHERE id = ?
+          AND (usage_limit IS NULL OR usage_count < usage_limit)
+    """, (datetime.utcnow().isoformat(), code_id))
+    consumed = cur.rowcount > 0
+    if consumed:
+        record_change(cur, code_id, "usage")
+    conn.commit()
+    conn.close()
+    return consumed
+
+
+@db_timer("consume")
+def refund_usage(code_id: int):
+    """إرجاع استخدام محجوز عندما يفشل التوليد"""
+    conn = get_connection()
+    cur = conn.cursor()
+    cur.execute("""
+        UPDATE activation_codes
+        SET usage_count = usage_count - 1
+        WHERE id = ? AND usage_count > 0
+    """, (code_id,))
+    if cur.rowcount:
+        record_change(cur, code_id, "refund")
+    conn.commit()
+    conn.close()
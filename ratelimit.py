@@ -0,0 +1,192 @@
+# ratelimit.py
+# حدود معدل بدلو الرموز (token bucket): لكل كود حسب باقته، ولكل IP على مسارات الكتالوج.
+# الوضع الافتراضي في ذاكرة كل عامل؛ RATE_LIMIT_BACKEND=sqlite يشارك الدلاء بين العمال
+import os
+import math
+import time
+import itertools
+import threading
+from typing import NamedTuple
+
+from starlette.concurrency import run_in_threadpool
+
+from database import get_connection
+from metrics import RATE_LIMITED
+
+RATE_LIMIT_BACKEND = os.getenv("RATE_LIMIT_BACKEND", "memory")
+MEMORY_MAX_KEYS = 100_000
+# كل كم قراراً يحذف العامل من rate_limits الدلاء التي امتلأت من جديد
+SQLITE_PRUNE_EVERY = 1000
+
+# الحدود بالطلبات في الدقيقة؛ السعة (burst) هي ما يمكن إرساله دفعة واحدة
+DEFAULT_CODE_RATE = float(os.getenv("CODE_RATE_PER_MIN", "6"))
+DEFAULT_CODE_BURST = int(os.getenv("CODE_BURST", "3"))
+IP_RATE = float(os.getenv("IP_RATE_PER_MIN", "120"))
+IP_BURST = int(os.getenv("IP_BURST", "60"))
+HISTORY_RATE = float(os.getenv("HISTORY_RATE_PER_MIN", "120"))
+HISTORY_BURST = int(os.getenv("HISTORY_BURST", "30"))
+
+# مسارات الكتالوج غير المحمية بكود؛ مسارات التوليد والسجل محدودة بالكود لا بالـ IP،
+# فمستخدمو مدرسة واحدة خلف NAT مشترك لا يتقاسمون دلواً واحداً
+IP_LIMITED_PREFIX = "/api/"
+IP_EXEMPT_PREFIXES = ("/api/generate-report-content", "/api/history")
+
+
+class Decision(NamedTuple):
+    allowed: bool
+    limit: int
+    remaining: int
+    reset: int
+    retry_after: int
+
+
+def _decide(tokens: float, allowed: bool, rate: float, burst: int) -> Decision:
+    """ترجمة حالة الدلو إلى قيم الترويسات (بالثواني)"""
+    per_second = rate / 60
+    if allowed:
+        retry_after = 0
+    else:
+        retry_after = math.ceil((1 - tokens) / per_second)
+    reset = math.ceil((burst - tokens) / per_second)
+    return Decision(allowed, burst, int(tokens), reset, retry_after)
+
+
+class MemoryBuckets:
+    """دلاء في ذاكرة العامل؛ الحد الفعلي للكود = الحد × عدد العمال"""
+
+    def __init__(self):
+        self.buckets = {}
+        self.lock = threading.Lock()
+
+    def take(self, key: str, rate: float, burst: int) -> Decision:
+        now = time.monotonic()
+        per_second = rate / 60
+        with self.lock:
+            tokens, updated = self.buckets.get(key, (burst, now, per_second, burst))[:2]
+            tokens = min(burst, tokens + (now - updated) * per_second)
+            allowed = tokens >= 1
+            if allowed:
+                tokens -= 1
+            if len(self.buckets) >= MEMORY_MAX_KEYS and key not in self.buckets:
+                self._prune(now)
+            self.buckets[key] = (tokens, now, per_second, burst)
+        return _decide(tokens, allowed, rate, burst)
+
+    def _prune(self, now: float):
+        # الدلو الذي امتلأ من جديد مطابق لدلو غير موجود
+        for key, (tokens, updated, per_second, burst) in list(self.buckets.items()):
+            if tokens + (now - updated) * per_second >= burst:
+                del self.buckets[key]
+
+
+class SQLiteBuckets:
+    """دلاء مشتركة بين العمال في جدول rate_limits؛ كل قرار عبارة UPSERT واحدة ذرّية.
+    full_at وقت امتلاء الدلو، وبعده يطابق الصف دلواً غير موجود فيُحذف"""
+
+    def __init__(self):
+        self.calls = itertools.count(1)
+
+    def take(self, key: str, rate: float, burst: int) -> Decision:
+        params = {"key": key, "now": time.time(), "per_second": rate / 60, "burst": burst}
+        conn = get_connection()
+        try:
+            cur = conn.cursor()
+            cur.execute("""
+                INSERT INTO rate_limits (key, tokens, updated_at, allowed, full_at)
+                VALUES (:key, :burst - 1, :now, 1, :now + 1 / :per_second)
+                ON CONFLICT(key) DO UPDATE SET
+                    allowed = MIN(:burst, tokens + (:now - updated_at) * :per_second) >= 1,
+                    tokens = MIN(:burst, tokens + (:now - updated_at) * :per_second)
+                        - (MIN(:burst, tokens + (:now - updated_at) * :per_second) >= 1),
+                    full_at = :now + (:burst - MIN(:burst, tokens + (:now - updated_at) * :per_second)
+                        + (MIN(:burst, tokens + (:now - updated_at) * :per_second) >= 1)) / :per_second,
+                    updated_at = :now
+                RETURNING tokens, allowed
+            """, params)
+            tokens, allowed = cur.fetchone()
+            if next(self.calls) % SQLITE_PRUNE_EVERY == 0:
+                cur.execute(
+                    "DELETE FROM rate_limits WHERE full_at IS NULL OR full_at < ?", (params["now"],)
+                )
+            conn.commit()
+        finally:
+            conn.close()
+        return _decide(tokens, bool(allowed), rate, burst)
+
+
+def _backend():
+    if RATE_LIMIT_BACKEND == "sqlite":
+        return SQLiteBuckets()
+    if RATE_LIMIT_BACKEND == "memory":
+        return MemoryBuckets()
+    return None
+
+
+limiter = _backend()
+
+
+def check(scope: str, key, rate: float, burst: int) -> Decision:
+    """أخذ رمز من دلو المفتاح؛ None إن كانت الحدود معطلة"""
+    if limiter is None:
+        return None
+    decision = limiter.take(f"{scope}:{key}", rate, burst)
+    if not decision.allowed:
+        RATE_LIMITED.labels(scope).inc()
+    return decision
+
+
+def rate_limit_headers(decision: Decision) -> dict:
+    headers = {
+        "RateLimit-Limit": str(decision.limit),
+        "RateLimit-Remaining": str(decision.remaining),
+        "RateLimit-Reset": str(decision.reset),
+    }
+    if not decision.allowed:
+        headers["Retry-After"] = str(decision.retry_after)
+    return headers
+
+
+class RateLimitMiddleware:
+    """حد لكل IP على مسارات الكتالوج، مع ترويسات RateLimit-* على كل استجابة منها"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        path = scope.get("path", "")
+        if (
+            scope["type"] != "http"
+            or limiter is None
+            or not path.startswith(IP_LIMITED_PREFIX)
+            or path.startswith(IP_EXEMPT_PREFIXES)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        client = scope.get("client")
+        ip = client[0] if client else "unknown"
+        if isinstance(limiter, SQLiteBuckets):
+            decision = await run_in_threadpool(check, "ip", ip, IP_RATE, IP_BURST)
+        else:
+            decision = check("ip", ip, IP_RATE, IP_BURST)
+        headers = [(k.lower().encode(), v.encode()) for k, v in rate_limit_headers(decision).items()]
+
+        if not decision.allowed:
+            body = b'{"detail":"Too many requests"}'
+            await send({
+                "type": "http.response.start",
+                "status": 429,
+                "headers": headers + [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode()),
+                ],
+            })
+            await send({"type": "http.response.body", "body": body})
+            return
+
+        async def send_with_headers(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
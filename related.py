@@ -0,0 +1,80 @@
+# related.py
+import math
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from search import padded_trigrams, stem, tokenize
+
+RELATED_K = 30
+CHUNK = 256
+
+
+def _features(name: str) -> Dict[str, int]:
+    """مفردات الاسم بعد التطبيع (كلمات + trigrams حرفية) مع تكراراتها"""
+    counts: Dict[str, int] = {}
+    for word in tokenize(name):
+        for feature in ["w:" + stem(word)] + ["c:" + g for g in padded_trigrams(word)]:
+            counts[feature] = counts.get(feature, 0) + 1
+    return counts
+
+
+class RelatedIndex:
+    """جدول أقرب التقارير حسب تشابه جيب التمام على مصفوفة TF-IDF"""
+
+    def __init__(self, reports, k: int = RELATED_K):
+        self.reports = list(reports)
+        self.position = {r.id: i for i, r in enumerate(self.reports)}
+        n = len(self.reports)
+        docs = [_features(r.name) for r in self.reports]
+
+        df: Dict[str, int] = {}
+        for counts in docs:
+            for feature in counts:
+                df[feature] = df.get(feature, 0) + 1
+        # الميزة التي تظهر في تقرير واحد لا تساهم في التشابه بين تقريرين
+        vocab = {f: i for i, f in enumerate(f for f, c in df.items() if c > 1)}
+        idf = np.zeros(len(vocab), dtype=np.float32)
+        for feature, col in vocab.items():
+            idf[col] = math.log((1 + n) / (1 + df[feature])) + 1
+
+        matrix = np.zeros((n, len(vocab)), dtype=np.float32)
+        for row, counts in enumerate(docs):
+            for feature, tf in counts.items():
+                col = vocab.get(feature)
+                if col is not None:
+                    matrix[row, col] = 1 + math.log(tf)
+        matrix *= idf
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        matrix /= np.where(norms == 0, 1, norms)
+
+        k = min(k, max(n - 1, 0))
+        self.neighbors = np.zeros((n, k), dtype=np.int32)
+        self.scores = np.zeros((n, k), dtype=np.float32)
+        if k == 0:
+            return
+        for start in range(0, n, CHUNK):
+            sims = matrix[start:start + CHUNK] @ matrix.T
+            rows = np.arange(sims.shape[0])
+            sims[rows, rows + start] = -1
+            top = np.argpartition(-sims, k - 1, axis=1)[:, :k]
+            top_scores = np.take_along_axis(sims, top, axis=1)
+            order = np.argsort(-top_scores, axis=1, kind="stable")
+            self.neighbors[start:start + CHUNK] = np.take_along_axis(top, order, axis=1)
+            self.scores[start:start + CHUNK] = np.take_along_axis(top_scores, order, axis=1)
+
+    def related(self, report_id: str, limit: int = 10, same_subcategory: bool = False) -> List[Tuple[float, object]]:
+        """أقرب التقارير لتقرير معين من الجدول المحسوب مسبقاً"""
+        row = self.position[report_id]
+        source = self.reports[row]
+        results = []
+        for col, score in zip(self.neighbors[row].tolist(), self.scores[row].tolist()):
+            if score <= 0:
+                break
+            report = self.reports[col]
+            if not same_subcategory and report.subcategory_id == source.subcategory_id:
+                continue
+            results.append((round(score, 4), report))
+            if len(results) == limit:
+                break
+        return results
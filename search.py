@@ -0,0 +1,487 @@
+# search.py
+import re
+import heapq
+from collections import Counter
+from itertools import accumulate, chain, groupby
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, List, Optional, Tuple
+
+# ---------- تطبيع النص العربي ----------
+_TASHKEEL = re.compile(r"[\u0610-\u061A\u064B-\u065F\u0670\u06D6-\u06ED\u0640]")
+_NON_WORD = re.compile(r"[^\w]+")
+# آخر كلمة في النص كما يقسمه normalize: حروف الكلمة مع تشكيلها، وأي حرف آخر فاصل
+_LAST_WORD = re.compile(r"(?:\w|" + _TASHKEEL.pattern + r")+$")
+_CHAR_MAP = str.maketrans({
+    "أ": "ا", "إ": "ا", "آ": "ا", "ٱ": "ا",
+    "ى": "ي", "ئ": "ي",
+    "ؤ": "و",
+    "ة": "ه",
+})
+_PREFIXES = ("وال", "بال", "فال", "كال", "لل", "ال")
+
+NGRAM = 3
+FUZZY_THRESHOLD = 0.35
+FUZZY_CANDIDATES = 40
+AUTOCOMPLETE_MAX = 20
+AUTOCOMPLETE_CACHED_PREFIX = 2
+
+
+def normalize(text: str) -> str:
+    """توحيد أشكال الحروف وإزالة التشكيل والتطويل وعلامات الترقيم"""
+    text = _TASHKEEL.sub("", text.lower()).translate(_CHAR_MAP)
+    return " ".join(_NON_WORD.sub(" ", text).split())
+
+
+def tokenize(text: str) -> List[str]:
+    return normalize(text).split()
+
+
+def stem(token: str) -> str:
+    """إزالة أداة التعريف وما يسبقها من حروف الجر والعطف"""
+    for prefix in _PREFIXES:
+        if token.startswith(prefix) and len(token) - len(prefix) >= 2:
+            return token[len(prefix):]
+    return token
+
+
+def ngrams(token: str, n: int = NGRAM):
+    if len(token) < n:
+        return {token}
+    return {token[i:i + n] for i in range(len(token) - n + 1)}
+
+
+def padded_trigrams(word: str):
+    padded = f" {word} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def deletes(word: str):
+    """الكلمة وكل صيغها بعد حذف حرف واحد"""
+    return {word} | {word[:i] + word[i + 1:] for i in range(len(word))}
+
+
+def within_one_edit(a: str, b: str) -> bool:
+    """هل الفرق بين الكلمتين حرف واحد: استبدال أو حذف أو إضافة أو تبديل حرفين متجاورين"""
+    if abs(len(a) - len(b)) > 1:
+        return False
+    if len(a) > len(b):
+        a, b = b, a
+    i = 0
+    while i < len(a) and a[i] == b[i]:
+        i += 1
+    if len(a) < len(b):
+        return a[i:] == b[i + 1:]
+    return a[i + 1:] == b[i + 1:] or (a[i + 1:i + 2] == b[i:i + 1] and a[i:i + 1] == b[i + 1:i + 2] and a[i + 2:] == b[i + 2:])
+
+
+# ---------- فهرس التشابه (trigrams) ----------
+class TrigramIndex:
+    """فهرس trigrams لمفردات الكتالوج لاقتراح أقرب الكلمات للكلمة المكتوبة خطأ.
+    trigrams لا تلتقط خطأ حرف واحد في الكلمات القصيرة ("خظه" و"خطه" بلا trigram مشترك)،
+    فتُفهرس الكلمات أيضاً بصيغها بعد حذف حرف واحد لإيجاد ما يبعد حرفاً واحداً"""
+
+    def __init__(self, words, counts=None):
+        self.words = sorted(set(words))
+        self.counts = counts or {}
+        self.sizes = []
+        self.postings: Dict[str, List[int]] = {}
+        self.deletes: Dict[str, List[int]] = {}
+        for word_id, word in enumerate(self.words):
+            grams = padded_trigrams(word)
+            self.sizes.append(len(grams))
+            for gram in grams:
+                self.postings.setdefault(gram, []).append(word_id)
+            for variant in deletes(word):
+                self.deletes.setdefault(variant, []).append(word_id)
+
+    def similar(
+        self,
+        word: str,
+        threshold: float = FUZZY_THRESHOLD,
+        max_candidates: int = FUZZY_CANDIDATES,
+    ) -> List[Tuple[str, float]]:
+        """أقرب الكلمات مرتبة تنازلياً؛ ما يبعد حرفاً واحداً درجته 1 - 1/طول الكلمة،
+        والباقي بمعامل جاكارد على trigrams، والتعادل للكلمة الأكثر وروداً"""
+        scores: Dict[int, float] = {}
+        for variant in deletes(word):
+            for word_id in self.deletes.get(variant, ()):
+                candidate = self.words[word_id]
+                if word_id not in scores and within_one_edit(word, candidate):
+                    scores[word_id] = 1 - (candidate != word) / max(len(word), len(candidate))
+
+        grams = padded_trigrams(word)
+        shared: Dict[int, int] = {}
+        for gram in grams:
+            for word_id in self.postings.get(gram, ()):
+                shared[word_id] = shared.get(word_id, 0) + 1
+
+        best = heapq.nlargest(max_candidates, shared.items(), key=lambda item: item[1])
+        for word_id, common in best:
+            score = common / (len(grams) + self.sizes[word_id] - common)
+            scores[word_id] = max(score, scores.get(word_id, 0))
+
+        results = [
+            (self.words[word_id], round(score, 4))
+            for word_id, score in scores.items()
+            if score >= threshold
+        ]
+        results.sort(key=lambda item: (-item[1], -self.counts.get(item[0], 0), item[0]))
+        return results[:max_candidates]
+
+
+# ---------- فهرس البادئات للإكمال التلقائي ----------
+class PrefixIndex:
+    """مصفوفة مرتبة من الكلمات المطبّعة للبحث بالبادئة عبر bisect"""
+
+    def __init__(self, entries):
+        # entries: (المفتاح المطبّع، الكلمة كما وردت، عدد مرات الورود، ترتيب أول ورود)
+        entries = sorted(entries)
+        self.keys = [e[0] for e in entries]
+        self.entries = entries
+        # البادئات القصيرة تغطي نطاقات واسعة، فتُحسب نتائجها مسبقاً
+        self.cached: Dict[str, List[Tuple[str, int]]] = {}
+        for key in set(self.keys):
+            for n in range(1, min(len(key), AUTOCOMPLETE_CACHED_PREFIX) + 1):
+                self.cached.setdefault(key[:n], None)
+        for prefix in self.cached:
+            self.cached[prefix] = self._scan(prefix, AUTOCOMPLETE_MAX)
+
+    def _scan(self, prefix: str, limit: int) -> List[Tuple[str, int]]:
+        start = bisect_left(self.keys, prefix)
+        end = bisect_left(self.keys, prefix + "\uffff", start)
+        ranked = sorted(self.entries[start:end], key=lambda e: (-e[2], e[3]))
+        results = []
+        seen = set()
+        for _, word, count, _ in ranked:
+            if word not in seen:
+                seen.add(word)
+                results.append((word, count))
+                if len(results) == limit:
+                    break
+        return results
+
+    def complete(self, prefix: str, limit: int = 10) -> List[Tuple[str, int]]:
+        """أكثر الكلمات وروداً التي تبدأ بالبادئة، ثم الأسبق في ترتيب الكتالوج"""
+        cached = self.cached.get(prefix)
+        if cached is not None:
+            return cached[:limit]
+        if len(prefix) <= AUTOCOMPLETE_CACHED_PREFIX:
+            return []
+        return self._scan(prefix, limit)
+
+
+# ---------- الفهرس المقلوب ----------
+class ReportIndex:
+    """فهرس مقلوب لأسماء التقارير بعد التطبيع مع n-grams للبحث الجزئي"""
+
+    def __init__(self, docs, extra_names=()):
+        # docs: قائمة من (report, criterion_id) بترتيب الكتالوج
+        # extra_names: أسماء التصنيفات والمعايير، تدخل في مفردات البحث التقريبي فقط
+        self.docs = []
+        self.names = []
+        self.tokens = []
+        self.criteria = []
+        self.by_criterion: Dict[Any, set] = {}
+        self.postings: Dict[str, Dict[int, List[int]]] = {}
+        self.grams: Dict[str, List[int]] = {}
+
+        for doc_id, (report, criterion_id) in enumerate(docs):
+            tokens = tokenize(report.name)
+            self.docs.append(report)
+            self.names.append(" ".join(tokens))
+            self.tokens.append(tokens)
+            self.criteria.append(criterion_id)
+            self.by_criterion.setdefault(criterion_id, set()).add(doc_id)
+
+            for pos, token in enumerate(tokens):
+                for key in {token, stem(token)}:
+                    self.postings.setdefault(key, {}).setdefault(doc_id, []).append(pos)
+                for gram in ngrams(token):
+                    bucket = self.grams.setdefault(gram, [])
+                    if not bucket or bucket[-1] != doc_id:
+                        bucket.append(doc_id)
+
+        self.vocab = sorted(self.postings)
+        # كل الأسماء في نص واحد: عبارة البحث إن لم توجد فيه فلا تقرير يستحق مكافأة العبارة
+        self.all_names = "\n".join(self.names)
+        self.name_offsets = list(accumulate((len(name) + 1 for name in self.names[:-1]), initial=0))
+        self.short_prefixes: Dict[str, Dict[int, List[int]]] = {}
+        # تقارير كل كلمة مجمعة حسب موضع أول ورودها، لترتيب المطابقات دون المرور على كل تقرير
+        self.first_positions: Dict[str, Dict[int, set]] = {}
+
+        # الشكل الأصلي لكل كلمة مطبّعة، لعرض الاقتراح كما كُتب في الكتالوج
+        self.surface: Dict[str, str] = {}
+        counts: Dict[str, int] = {}
+        first: Dict[str, int] = {}
+        for order, name in enumerate([r.name for r in self.docs] + list(extra_names)):
+            raw = _NON_WORD.sub(" ", _TASHKEEL.sub("", name)).split()
+            words = tokenize(name)
+            for word, original in zip(words, raw):
+                self.surface.setdefault(word, original)
+                first.setdefault(word, order)
+            for word in set(words):
+                counts[word] = counts.get(word, 0) + 1
+        self.trigrams = TrigramIndex(self.surface, counts)
+
+        # الكلمة مفهرسة بشكلها الكامل وبدون أداة التعريف ("فسح" تكمل "الفسحة")
+        entries = []
+        for word, original in self.surface.items():
+            for key in {word, stem(word)}:
+                entries.append((key, original, counts[word], first[word]))
+        self.prefixes = PrefixIndex(entries)
+
+    def __len__(self):
+        return len(self.docs)
+
+    def autocomplete(self, text: str, limit: int = 10) -> List[Tuple[str, str, int]]:
+        """إكمال الكلمة الأخيرة في النص؛ يعيد (النص المكتمل، الكلمة، عدد مرات الورود)"""
+        last = _LAST_WORD.search(text)
+        if not last:
+            return []
+        words = tokenize(text)
+        if not words:
+            return []
+        head = text[:last.start()] if len(words) > 1 else ""
+        return [
+            (head + word, word, count)
+            for word, count in self.prefixes.complete(words[-1], limit)
+        ]
+
+    def _token_positions(self, token: str) -> Dict[int, List[int]]:
+        """مواضع الكلمة في كل تقرير: تطابق تام، ثم الجذر، ثم تطابق جزئي"""
+        exact = self.postings.get(token)
+        if exact is None:
+            exact = self.postings.get(stem(token))
+        if exact is not None:
+            return exact
+
+        # كلمة غير مكتملة: تقاطع قوائم n-grams ثم التحقق من وجودها داخل الكلمات
+        if len(token) < NGRAM:
+            # البادئات القصيرة قليلة وتغطي معظم الكتالوج، فتُحفظ نتيجتها
+            found = self.short_prefixes.get(token)
+            if found is not None:
+                return found
+            start = bisect_left(self.vocab, token)
+            found = {}
+            for word in self.vocab[start:]:
+                if not word.startswith(token):
+                    break
+                for doc_id, positions in self.postings[word].items():
+                    found.setdefault(doc_id, []).extend(positions)
+            for positions in found.values():
+                positions.sort()
+            if found:
+                self.short_prefixes[token] = found
+            return found
+
+        lists = [self.grams.get(g) for g in ngrams(token)]
+        if not all(lists):
+            return {}
+        lists.sort(key=len)
+        candidates = set(lists[0])
+        for other in lists[1:]:
+            candidates.intersection_update(other)
+            if not candidates:
+                return {}
+
+        found = {}
+        for doc_id in candidates:
+            positions = [i for i, word in enumerate(self.tokens[doc_id]) if token in word]
+            if positions:
+                found[doc_id] = positions
+        return found
+
+    def _by_first_position(self, token: str, docs: Dict[int, List[int]]) -> Dict[int, set]:
+        """تقارير الكلمة مجمعة حسب موضع أول ورود لها"""
+        found = self.first_positions.get(token)
+        if found is not None:
+            return found
+        found = {}
+        for doc_id, positions in docs.items():
+            found.setdefault(positions[0], set()).add(doc_id)
+        # نتائج التطابق الجزئي بـ n-grams لا تُحفظ حتى لا يكبر الجدول مع كل نص يُكتب
+        if docs is self.postings.get(token) or docs is self.postings.get(stem(token)) \
+                or docs is self.short_prefixes.get(token):
+            self.first_positions[token] = found
+        return found
+
+    def _phrase_docs(self, phrase: str) -> set:
+        """التقارير التي يرد اسمها العبارة كاملة، ببحث واحد في نص كل الأسماء"""
+        found = set()
+        at = self.all_names.find(phrase)
+        while at != -1:
+            found.add(bisect_right(self.name_offsets, at) - 1)
+            at = self.all_names.find(phrase, at + 1)
+        return found
+
+    def search(
+        self,
+        query: str,
+        limit: int = 20,
+        offset: int = 0,
+        criterion_id: Optional[str] = None,
+    ) -> Tuple[int, List[Tuple[float, Any]]]:
+        """البحث مع الترتيب حسب التغطية والتقارب والموضع؛ يعيد (العدد الكلي، النتائج)"""
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return 0, []
+        phrase = " ".join(tokenize(query))
+
+        term_docs = [self._token_positions(term) for term in terms]
+        by_first = [self._by_first_position(term, docs) for term, docs in zip(terms, term_docs)]
+        if criterion_id is not None:
+            allowed = self.by_criterion.get(criterion_id, set())
+            doc_sets = [docs.keys() & allowed for docs in term_docs]
+        else:
+            doc_sets = [docs.keys() for docs in term_docs]
+
+        n_terms = len(terms)
+        ordered = sorted(doc_sets, key=len)
+        full = set(ordered[0]).intersection(*ordered[1:])
+        matched = set().union(*doc_sets) if n_terms > 1 else ordered[0]
+        need = offset + limit
+        names = self.names
+        scored = []
+
+        def score(doc_id, hits, start=None):
+            if start is None or hits > 1:
+                positions = [docs[doc_id][0] for docs in term_docs if doc_id in docs]
+                start = min(positions)
+            value = hits / n_terms * 10
+            if hits > 1:
+                value += 2 * hits / (max(positions) - start + 1)
+            if phrase in names[doc_id]:
+                value += 3
+            return value + 1 / (1 + start)
+
+        def bound(hits, start, phrase_bonus=3):
+            # أقصى نقاط لتقرير بهذا العدد من الكلمات وأول موضع: أقصى تقارب مع تطابق العبارة إن أمكن
+            return hits / n_terms * 10 + (2 if hits > 1 else 0) + phrase_bonus + 1 / (1 + start)
+
+        def finished(hits):
+            # الصفحة اكتملت ولا يبلغها أي تقرير في الطبقات من هذه فما دون
+            return len(scored) >= need and bound(hits, 0) < -scored[-1][0]
+
+        def tiers():
+            # التغطية الكاملة أولاً، ثم الجزئية الأكثر كلمات فالأقل
+            yield n_terms, full
+            if n_terms == 1 or finished(n_terms - 1):
+                return
+            partial = matched - full
+            if n_terms == 2:
+                yield 1, partial
+                return
+            coverage = Counter(chain.from_iterable(doc_sets)).__getitem__
+            for hits, docs in groupby(sorted(partial, key=coverage, reverse=True), key=coverage):
+                if finished(hits):
+                    return
+                yield hits, set(docs)
+
+        for hits, tier in tiers():
+            if len(tier) <= need:
+                scored += [(-score(doc_id, hits), doc_id) for doc_id in tier]
+            else:
+                self._rank_by_first(tier, hits, by_first, phrase, score, bound, need, scored)
+            if len(scored) >= need:
+                scored[:] = heapq.nsmallest(need, scored)
+
+        page = sorted(scored)[offset:need]
+        return len(matched), [(round(-neg, 4), self.docs[doc_id]) for neg, doc_id in page]
+
+    def _rank_by_first(self, tier, hits, by_first, phrase, score, bound, need, scored):
+        """تقارير طبقة كبيرة حسب أول موضع تصاعدياً فيتناقص الحد الأعلى لنقاطها، ويتوقف الحساب حين
+        لا يبلغ حد الباقي آخر الصفحة؛ المتعادلون بالحد يُؤخذون بترتيب الكتالوج"""
+        if hits == len(by_first):
+            phrase_bonus = 3 if phrase in self.all_names else 0
+        else:
+            phrase_bonus = 3 if self._phrase_docs(phrase) & tier else 0
+        seen = set()
+        for start in sorted(set().union(*by_first)):
+            top = bound(hits, start, phrase_bonus)
+            if len(scored) >= need and top < -scored[-1][0]:
+                return
+            group = set().union(*[docs[start] for docs in by_first if start in docs])
+            group = sorted(group.intersection(tier).difference(seen))
+            if not group:
+                continue
+            seen.update(group)
+            for i in range(0, len(group), need):
+                if len(scored) >= need and scored[-1] < (-top, group[i]):
+                    break
+                scored += [(-score(doc_id, hits, start), doc_id) for doc_id in group[i:i + need]]
+                if len(scored) >= need:
+                    scored[:] = heapq.nsmallest(need, scored)
+            if len(seen) == len(tier):
+                return
+
+    def _score(self, doc_id, hits, n_terms, phrase, weights=None) -> float:
+        if weights is None:
+            coverage = len(hits) / n_terms
+        else:
+            coverage = sum(weights[doc_id].values()) / n_terms
+        starts = [p[0] for _, p in hits]
+        first = min(starts)
+        score = coverage * 10
+        if len(hits) > 1:
+            span = max(starts) - first + 1
+            score += 2 * len(hits) / span
+        if phrase in self.names[doc_id]:
+            score += 3
+        score += 1 / (1 + first)
+        return score
+
+    def _rank(self, candidates, score, limit, offset):
+        """صفحة النتائج بعد حساب نقاط كل المرشحين؛ التعادل بترتيب الكتالوج"""
+        page = heapq.nsmallest(offset + limit, ((-score(doc_id), doc_id) for doc_id in candidates))[offset:]
+        return [(round(-neg, 4), self.docs[doc_id]) for neg, doc_id in page]
+
+    def fuzzy_search(
+        self,
+        query: str,
+        limit: int = 20,
+        offset: int = 0,
+        criterion_id: Optional[str] = None,
+        threshold: float = FUZZY_THRESHOLD,
+    ) -> Tuple[int, List[Tuple[float, Any]], Optional[str]]:
+        """بحث متسامح مع الأخطاء الإملائية؛ يعيد (العدد الكلي، النتائج، الاقتراح)"""
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return 0, [], None
+        # الكلمات غير المصححة تُعرض في الاقتراح كما كتبها المستخدم
+        typed: Dict[str, str] = {}
+        for word, original in zip(tokenize(query), _NON_WORD.sub(" ", _TASHKEEL.sub("", query)).split()):
+            typed.setdefault(word, original)
+
+        corrected = []
+        matched: Dict[int, List[Tuple[int, List[int]]]] = {}
+        weights: Dict[int, Dict[int, float]] = {}
+        for term_no, term in enumerate(terms):
+            if term in self.postings:
+                variants = [(term, 1.0)]
+            elif stem(term) in self.postings:
+                variants = [(stem(term), 1.0)]
+            else:
+                variants = self.trigrams.similar(term, threshold)[:3]
+            corrected.append(variants[0][0] if variants and variants[0][1] < 1 else term)
+
+            for word, similarity in variants:
+                for doc_id, positions in self.postings.get(word, {}).items():
+                    if criterion_id is not None and self.criteria[doc_id] != criterion_id:
+                        continue
+                    doc_weights = weights.setdefault(doc_id, {})
+                    if similarity > doc_weights.get(term_no, 0):
+                        if term_no not in doc_weights:
+                            matched.setdefault(doc_id, []).append((term_no, positions))
+                        doc_weights[term_no] = similarity
+
+        suggestion = None
+        if corrected != terms:
+            suggestion = " ".join(
+                typed.get(term, term) if word == term else self.surface.get(word, word)
+                for term, word in zip(terms, corrected)
+            )
+        phrase = " ".join(corrected)
+        hits = self._rank(
+            matched, lambda d: self._score(d, matched[d], len(terms), phrase, weights), limit, offset
+        )
+        return len(matched), hits, suggestion
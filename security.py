@@ -1,49 +1,117 @@
-from fastapi import Header, HTTPException
+from fastapi import Depends, Header, HTTPException
+from typing import Optional, Tuple
+from collections import OrderedDict
 from database import get_connection
+from changes import ChangeWatcher
+from metrics import cache_result, db_timer
+from timing import annotate, span
 from datetime import datetime
+import os
+import threading
+import time
+
+# ---------- ذاكرة الأكواد ----------
+# كل طلب يتحقق أولاً من ChangeWatcher، فأي إيقاف أو حذف أو استخدام من عامل آخر
+# يُسقط مدخل ذلك الكود فوراً؛ TTL مجرد احتياط للتعديلات خارج التطبيق
+CODE_CACHE_TTL = float(os.getenv("CODE_CACHE_TTL", "60"))
+CODE_CACHE_SIZE = int(os.getenv("CODE_CACHE_SIZE", "50000"))
+
+_codes = OrderedDict()
+_ids = {}
+_lock = threading.Lock()
+watcher = ChangeWatcher()
+
+def _invalidate():
+    reset, changed = watcher.poll()
+    with _lock:
+        if reset:
+            _codes.clear()
+            _ids.clear()
+            return
+        for code_id in changed:
+            code = _ids.pop(code_id, None)
+            if code is not None:
+                _codes.pop(code, None)
+
+def lookup_code(code: str):
+    """(id, is_active, expires_at, usage_limit, usage_count, plan) أو None"""
+    _invalidate()
+    now = time.monotonic()
+    with _lock:
+        cached = _codes.get(code)
+        if cached and now - cached[0] < CODE_CACHE_TTL:
+            _codes.move_to_end(code)
+            cache_result("activation", True)
+            return cached[1]
+        seq = watcher.seq
+    cache_result("activation", False)
 
-def activation_required(
-    x_activation_code: str = Header(...)
-):
     conn = get_connection()
     cur = conn.cursor()
+    with db_timer("lookup"):
+        cur.execute("""
+            SELECT id, is_active, expires_at, usage_limit, usage_count, plan
+            FROM activation_codes
+            WHERE code=?
+        """, (code,))
+        row = cur.fetchone()
+    conn.close()
 
-    cur.execute("""
-        SELECT id, is_active, expires_at, usage_limit, usage_count
-        FROM activation_codes
-        WHERE code=?
-    """, (x_activation_code,))
-    row = cur.fetchone()
+    # الأكواد غير الموجودة لا تُخزّن حتى لا تملأ الذاكرة بمحاولات عشوائية
+    with _lock:
+        # إن رأى المراقب تغييرات أثناء القراءة فقد يكون الصف قديماً
+        if row and watcher.seq == seq:
+            _codes[code] = (now, row)
+            _ids[row[0]] = code
+            if len(_codes) > CODE_CACHE_SIZE:
+                _, (_, old) = _codes.popitem(last=False)
+                _ids.pop(old[0], None)
+    return row
+
+def enabled_record(x_activation_code: str = Header(...)):
+    """صف الكود إن كان موجوداً وغير موقوف، دون النظر في الانتهاء أو الرصيد؛
+    كل الاعتماديات التالية تبنى عليه، فيُقرأ الكود مرة واحدة لكل طلب"""
+    with span("auth"):
+        row = lookup_code(x_activation_code)
 
     if not row:
-        conn.close()
         raise HTTPException(
             status_code=403,
             detail="كود التفعيل غير صحيح"
         )
 
-    code_id, active, expires, limit, used = row
+    annotate(code_id=row[0])
 
-    if not active:
-        conn.close()
+    if not row[1]:
         raise HTTPException(
             status_code=403,
             detail="تم إيقاف هذا الاشتراك"
         )
+    return row
+
+def activation_record(row: tuple = Depends(enabled_record)) -> Tuple[int, Optional[str]]:
+    """التحقق من صلاحية الكود للتوليد (المدة والرصيد) وإرجاع (رقمه، باقته)"""
+    code_id, active, expires, limit, used, plan = row
 
     if expires and datetime.fromisoformat(expires) < datetime.utcnow():
-        conn.close()
         raise HTTPException(
             status_code=403,
             detail="انتهت مدة الاشتراك"
         )
 
     if limit is not None and used >= limit:
-        conn.close()
         raise HTTPException(
             status_code=403,
             detail="تم استهلاك جميع استخدامات الاشتراك"
         )
 
-    conn.close()
-    return code_id
\ No newline at end of file
+    return code_id, plan
+
+def activation_required(
+    record: Tuple[int, Optional[str]] = Depends(activation_record)
+) -> int:
+    return record[0]
+
+def history_access(row: tuple = Depends(enabled_record)) -> int:
+    """الكود المنتهي أو المستنفد يبقى قادراً على قراءة تقاريره السابقة"""
+    return row[0]
@@ -0,0 +1,111 @@
+# stats.py
+import os
+import time
+import threading
+from datetime import datetime, timedelta
+
+from database import get_connection
+from code_filters import STATUS_CONDITIONS
+from metrics import cache_result, db_timer
+
+STATS_TTL = float(os.getenv("STATS_TTL", "10"))
+ISSUED_DAYS = 30
+
+_cache = {}
+_lock = threading.Lock()
+
+# نسبة الاستخدام إلى الحد؛ المقارنات بالضرب لتبقى حسابات صحيحة
+_USAGE_BUCKETS = {
+    "0%": "usage_limit IS NOT NULL AND usage_count = 0",
+    "1-25%": "usage_count > 0 AND usage_count < usage_limit AND usage_count * 4 <= usage_limit",
+    "26-50%": "usage_count * 4 > usage_limit AND usage_count * 2 <= usage_limit",
+    "51-75%": "usage_count * 2 > usage_limit AND usage_count * 4 <= usage_limit * 3",
+    "76-99%": "usage_count * 4 > usage_limit * 3 AND usage_count < usage_limit",
+    "100%": "usage_count > 0 AND usage_count >= usage_limit",
+    "unlimited": "usage_limit IS NULL",
+}
+
+# طول بادئة created_at لكل فترة تجميع
+PERIODS = {"day": 10, "month": 7}
+
+
+@db_timer("admin")
+def compute_stats(period: str = "day") -> dict:
+    """إحصاءات الأكواد محسوبة بالكامل داخل SQLite"""
+    now = datetime.utcnow()
+    params = {"now": now.isoformat()}
+
+    conn = get_connection()
+    cur = conn.cursor()
+
+    # مرور واحد على الجدول يكفي للحالات وتوزيع الاستخدام والإجماليات،
+    # بشروط رقمية داخل SUM دون GROUP BY أو مقارنة نصوص لكل صف
+    statuses = [s for s in STATUS_CONDITIONS if s != "active"]
+    conditions = [STATUS_CONDITIONS[s] for s in statuses] + list(_USAGE_BUCKETS.values())
+    columns = ", ".join(f"SUM({c})" for c in conditions)
+    cur.execute(f"""
+        SELECT COUNT(*), COALESCE(SUM(usage_count), 0), {columns}
+        FROM activation_codes
+    """, params)
+    row = cur.fetchone()
+    total, total_usage = row[0], row[1]
+    counts = [n or 0 for n in row[2:]]
+    by_status = dict(zip(statuses, counts))
+    by_status["active"] = total - sum(by_status.values())
+    usage_distribution = dict(zip(_USAGE_BUCKETS, counts[len(statuses):]))
+
+    cur.execute("""
+        SELECT COALESCE(plan, 'unknown'), COUNT(*)
+        FROM activation_codes
+        GROUP BY plan
+    """)
+    issued_by_plan = dict(cur.fetchall())
+
+    since = (now - timedelta(days=ISSUED_DAYS)).isoformat()
+    cur.execute("""
+        SELECT substr(created_at, 1, ?) AS period, COALESCE(plan, 'unknown'), COUNT(*)
+        FROM activation_codes
+        WHERE created_at >= ?
+        GROUP BY period, plan
+        ORDER BY period
+    """, (PERIODS[period], since))
+    issued = [{"period": p, "plan": plan, "count": n} for p, plan, n in cur.fetchall()]
+
+    cur.execute("""
+        SELECT
+            SUM(CASE WHEN last_used_at >= ? THEN 1 ELSE 0 END),
+            COUNT(*)
+        FROM activation_codes
+        WHERE last_used_at >= ?
+    """, ((now - timedelta(hours=24)).isoformat(), (now - timedelta(days=7)).isoformat()))
+    used_24h, used_7d = cur.fetchone()
+    conn.close()
+
+    return {
+        "total": total,
+        "by_status": by_status,
+        "total_usage": total_usage,
+        "usage_distribution": usage_distribution,
+        "issued_by_plan": issued_by_plan,
+        "issued": issued,
+        "codes_used_24h": used_24h or 0,
+        "codes_used_7d": used_7d,
+        "generated_at": now.isoformat()
+    }
+
+
+def get_stats(period: str = "day") -> dict:
+    """الإحصاءات مع تخزين مؤقت قصير لتخفيف الضغط عند تحديث لوحة التحكم"""
+    cached = _cache.get(period)
+    if cached and time.monotonic() - cached[0] < STATS_TTL:
+        cache_result("stats", True)
+        return cached[1]
+    with _lock:
+        cached = _cache.get(period)
+        if cached and time.monotonic() - cached[0] < STATS_TTL:
+            cache_result("stats", True)
+            return cached[1]
+        cache_result("stats", False)
+        result = compute_stats(period)
+        _cache[period] = (time.monotonic(), result)
+        return result
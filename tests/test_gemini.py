@@ -0,0 +1,61 @@
+# tests/test_gemini.py
+import itertools
+
+import pytest
+from fastapi import HTTPException
+from google.api_core import exceptions
+
+import gemini
+from breaker import CircuitBreaker
+
+
+@pytest.fixture
+def keys(monkeypatch):
+    """مفاتيح وهمية وعميل يسجل كل استدعاء ويرفع الخطأ المحدد لمفتاحه"""
+    def setup(errors):
+        calls, sleeps = [], []
+        keys = list(errors)
+
+        class Client:
+            def __init__(self, index):
+                self.index = index
+
+            def generate_content(self, request, retry=None, timeout=None):
+                calls.append((keys[self.index], retry))
+                raise errors[keys[self.index]]("x")
+
+        monkeypatch.setattr(gemini, "api_keys", keys)
+        monkeypatch.setattr(gemini, "key_cycle", itertools.cycle(range(len(keys))))
+        monkeypatch.setattr(gemini, "key_breakers", [CircuitBreaker(k) for k in keys])
+        monkeypatch.setattr(gemini, "global_breaker", CircuitBreaker("global"))
+        monkeypatch.setattr(gemini, "client_for", Client)
+        monkeypatch.setattr(gemini.time, "sleep", sleeps.append)
+        return calls, sleeps
+    return setup
+
+
+def test_single_key_quota_error_is_not_repeated(keys):
+    calls, sleeps = keys({"k1": exceptions.ResourceExhausted})
+    with pytest.raises(HTTPException) as e:
+        gemini.generate("p")
+    assert e.value.status_code == 503
+    assert calls == [("k1", None)]
+    assert sleeps == []
+
+
+def test_each_key_tried_once_on_quota_errors(keys):
+    calls, sleeps = keys({"k1": exceptions.ResourceExhausted, "k2": exceptions.ResourceExhausted})
+    with pytest.raises(HTTPException):
+        gemini.generate("p")
+    assert sorted(k for k, _ in calls) == ["k1", "k2"]
+    assert sleeps == []
+
+
+def test_upstream_errors_back_off_between_attempts(keys):
+    calls, sleeps = keys({"k1": exceptions.ServiceUnavailable})
+    with pytest.raises(HTTPException):
+        gemini.generate("p")
+    assert len(calls) == gemini.GEMINI_MAX_ATTEMPTS
+    assert len(sleeps) == gemini.GEMINI_MAX_ATTEMPTS - 1
+    # إعادة المحاولة الداخلية في العميل معطلة في كل استدعاء
+    assert all(retry is None for _, retry in calls)
@@ -0,0 +1,51 @@
+# tests/test_search.py
+from types import SimpleNamespace
+
+from search import ReportIndex, tokenize
+
+
+def build(names, criterion="c1"):
+    return ReportIndex(
+        (SimpleNamespace(id=f"r{i}", name=name), criterion) for i, name in enumerate(names)
+    )
+
+
+def full_ranking(index, query, limit):
+    """ترتيب كل المطابقات بـ _score مباشرة، للمقارنة"""
+    terms = tokenize(query)
+    term_docs = [index._token_positions(t) for t in dict.fromkeys(terms)]
+    matched = set().union(*term_docs)
+    scored = sorted(
+        (-index._score(d, [(i, docs[d]) for i, docs in enumerate(term_docs) if d in docs],
+                       len(term_docs), " ".join(terms)), d)
+        for d in matched
+    )
+    return [index.docs[d].id for _, d in scored[:limit]]
+
+
+def test_rare_term_in_late_report_ranks_first():
+    # لا تقرير يحوي الكلمتين؛ الكلمة النادرة في أول اسم التقرير الأخير
+    names = [f"متابعة حضور الطلاب {i}" for i in range(200)] + ["أعمال التطوع"]
+    index = build(names)
+    total, hits = index.search("أعمال الطلاب", limit=5)
+    assert total == 201
+    assert hits[0][1].id == "r200"
+    assert [r.id for _, r in hits] == full_ranking(index, "أعمال الطلاب", 5)
+
+
+def test_early_position_in_late_report_ranks_first():
+    names = [f"خطة متابعة الطلاب {i}" for i in range(200)] + ["الطلاب المتفوقون"]
+    index = build(names)
+    _, hits = index.search("الطلاب", limit=5)
+    assert hits[0][1].id == "r200"
+
+
+def test_pages_match_full_ranking():
+    names = [f"تقرير عن {w} الطلاب" for w in ("تنفيذ", "خطة", "زيارة", "متابعة")] * 40
+    names += ["تقرير زيارة", "تنفيذ خطة علاجية", "الطلاب تقرير عن تنفيذ"]
+    index = build(names)
+    for query in ("تقرير عن تنفيذ", "الطلاب زيارة", "تق", "خطة"):
+        expected = full_ranking(index, query, 30)
+        for offset in (0, 5, 20):
+            _, hits = index.search(query, limit=10, offset=offset)
+            assert [r.id for _, r in hits] == expected[offset:offset + 10]
@@ -0,0 +1,135 @@
+# timing.py
+# تفصيل زمن الطلب على مراحله: ترويسة Server-Timing وسجل للطلبات البطيئة.
+# معطّل افتراضياً؛ عندها لا يُضاف الوسيط وتكلف span() قراءة ContextVar واحدة
+import os
+import json
+import time
+import logging
+from contextvars import ContextVar
+from datetime import datetime
+from logging.handlers import RotatingFileHandler
+from typing import Optional
+
+TIMING_ENABLED = os.getenv("REQUEST_TIMING", "0") == "1"
+SLOW_REQUEST_MS = float(os.getenv("SLOW_REQUEST_MS", "1000"))
+SLOW_LOG_PATH = os.getenv("SLOW_LOG_PATH", "slow_requests.log")
+SLOW_LOG_MAX_BYTES = int(os.getenv("SLOW_LOG_MAX_BYTES", str(10 * 1024 * 1024)))
+SLOW_LOG_BACKUPS = int(os.getenv("SLOW_LOG_BACKUPS", "5"))
+
+
+class RequestTiming:
+    """مراحل الطلب الحالي وحقوله؛ كائن واحد يُشارك بالمرجع مع خيوط المجمّع"""
+    __slots__ = ("phases", "fields")
+
+    def __init__(self):
+        self.phases = {}
+        self.fields = {}
+
+
+_current: ContextVar[Optional[RequestTiming]] = ContextVar("request_timing", default=None)
+
+
+class _Span:
+    __slots__ = ("timing", "name", "start")
+
+    def __init__(self, timing: RequestTiming, name: str):
+        self.timing = timing
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        phases = self.timing.phases
+        phases[self.name] = phases.get(self.name, 0.0) + time.perf_counter() - self.start
+        return False
+
+
+class _NoSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NO_SPAN = _NoSpan()
+
+
+def span(name: str):
+    """قياس مرحلة داخل الطلب الحالي (with span("gemini"): ...)؛ تتراكم المراحل المتكررة"""
+    timing = _current.get()
+    if timing is None:
+        return _NO_SPAN
+    return _Span(timing, name)
+
+
+def annotate(**fields):
+    """حقول إضافية لسجل الطلب البطيء (رقم المفتاح، رقم الكود...)"""
+    timing = _current.get()
+    if timing is not None:
+        timing.fields.update(fields)
+
+
+def _slow_logger() -> logging.Logger:
+    logger = logging.getLogger("slow_requests")
+    if not logger.handlers:
+        handler = RotatingFileHandler(
+            SLOW_LOG_PATH, maxBytes=SLOW_LOG_MAX_BYTES, backupCount=SLOW_LOG_BACKUPS, encoding="utf-8"
+        )
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+    return logger
+
+
+def _server_timing(phases: dict, total: float) -> bytes:
+    entries = [f"{name};dur={seconds * 1000:.1f}" for name, seconds in phases.items()]
+    entries.append(f"total;dur={total * 1000:.1f}")
+    return ", ".join(entries).encode("latin-1")
+
+
+class TimingMiddleware:
+    """إضافة Server-Timing لكل استجابة وتسجيل الطلبات التي تتجاوز SLOW_REQUEST_MS"""
+
+    def __init__(self, app):
+        self.app = app
+        self.logger = _slow_logger()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timing = RequestTiming()
+        token = _current.set(timing)
+        start = time.perf_counter()
+        status = 500
+
+        async def send_with_timing(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                header = _server_timing(timing.phases, time.perf_counter() - start)
+                message["headers"] = list(message.get("headers", [])) + [(b"server-timing", header)]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current.reset(token)
+            total_ms = (time.perf_counter() - start) * 1000
+            if total_ms >= SLOW_REQUEST_MS:
+                self.logger.info(json.dumps({
+                    "at": datetime.utcnow().isoformat(),
+                    "method": scope["method"],
+                    "route": getattr(scope.get("route"), "path", scope["path"]),
+                    "status": status,
+                    "total_ms": round(total_ms, 1),
+                    "phases": {name: round(s * 1000, 1) for name, s in timing.phases.items()},
+                    **timing.fields
+                }, ensure_ascii=False))
@@ -0,0 +1,182 @@
+# transfer.py
+import io
+import csv
+import json
+import codecs
+from datetime import datetime
+from typing import Iterator, List, Optional
+
+from database import get_connection
+from fast_json import dumps
+from changes import record_changes
+from metrics import db_timer
+
+EXPORT_COLUMNS = (
+    "id", "code", "is_active", "created_at", "expires_at",
+    "usage_limit", "usage_count", "last_used_at", "plan",
+)
+FETCH_SIZE = 1000
+IMPORT_BATCH = 1000
+MAX_REPORTED_ERRORS = 100
+FORMATS = ("csv", "jsonl")
+
+
+# ---------- التصدير ----------
+def export_codes(fmt: str, where: str = "", params: Optional[dict] = None) -> Iterator[bytes]:
+    """تصدير الأكواد على دفعات من مؤشر القاعدة دون تحميل الجدول كاملاً في الذاكرة"""
+    conn = get_connection()
+    try:
+        cur = conn.cursor()
+        sql = f"SELECT {', '.join(EXPORT_COLUMNS)} FROM activation_codes"
+        if where:
+            sql += f" WHERE {where}"
+        cur.execute(sql + " ORDER BY id", params or {})
+
+        if fmt == "csv":
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(EXPORT_COLUMNS)
+            yield buffer.getvalue().encode("utf-8")
+
+        while True:
+            rows = cur.fetchmany(FETCH_SIZE)
+            if not rows:
+                break
+            if fmt == "csv":
+                buffer = io.StringIO()
+                csv.writer(buffer).writerows(rows)
+                yield buffer.getvalue().encode("utf-8")
+            else:
+                yield b"".join(dumps(dict(zip(EXPORT_COLUMNS, row))) + b"\n" for row in rows)
+    finally:
+        conn.close()
+
+
+# ---------- الاستيراد ----------
+def _optional_int(value):
+    if value is None or value == "":
+        return None
+    return int(value)
+
+
+def _optional_date(value):
+    if value is None or value == "":
+        return None
+    return datetime.fromisoformat(value).isoformat()
+
+
+def _flag(value):
+    if isinstance(value, bool):
+        return int(value)
+    if str(value).strip().lower() in ("1", "true", "yes"):
+        return 1
+    if str(value).strip().lower() in ("0", "false", "no"):
+        return 0
+    raise ValueError(f"invalid is_active {value!r}")
+
+
+def validate_row(row: dict) -> tuple:
+    """التحقق من صف مستورد وتحويله لقيم الجدول؛ يرفع ValueError عند الخطأ"""
+    code = str(row.get("code") or "").strip().upper()
+    if not code or not code.isalnum() or len(code) > 64:
+        raise ValueError(f"invalid code {row.get('code')!r}")
+    usage_limit = _optional_int(row.get("usage_limit"))
+    usage_count = _optional_int(row.get("usage_count")) or 0
+    if usage_count < 0 or (usage_limit is not None and usage_limit < 0):
+        raise ValueError("usage values must be non-negative")
+    return (
+        code,
+        _flag(row.get("is_active", 1)),
+        _optional_date(row.get("created_at")) or datetime.utcnow().isoformat(),
+        _optional_date(row.get("expires_at")),
+        usage_limit,
+        usage_count,
+        _optional_date(row.get("last_used_at")),
+        row.get("plan") or None,
+    )
+
+
+@db_timer("admin")
+def import_batch(rows: List[tuple], on_conflict: str) -> dict:
+    """إدخال دفعة من الصفوف الصحيحة في معاملة واحدة"""
+    conn = get_connection()
+    cur = conn.cursor()
+    try:
+        cur.execute("BEGIN IMMEDIATE")
+        codes = [row[0] for row in rows]
+        placeholders = ",".join("?" * len(codes))
+        cur.execute(f"SELECT code FROM activation_codes WHERE code IN ({placeholders})", codes)
+        existing = {row[0] for row in cur.fetchall()}
+
+        columns = ", ".join(EXPORT_COLUMNS[1:])
+        values = ", ".join("?" * (len(EXPORT_COLUMNS) - 1))
+        if on_conflict == "update":
+            updates = ", ".join(f"{c} = excluded.{c}" for c in EXPORT_COLUMNS[2:])
+            cur.executemany(
+                f"INSERT INTO activation_codes ({columns}) VALUES ({values}) "
+                f"ON CONFLICT(code) DO UPDATE SET {updates}",
+                rows
+            )
+            written = codes
+        else:
+            cur.executemany(
+                f"INSERT OR IGNORE INTO activation_codes ({columns}) VALUES ({values})",
+                rows
+            )
+            written = [code for code in codes if code not in existing]
+
+        if written:
+            placeholders = ",".join("?" * len(written))
+            cur.execute(f"SELECT id FROM activation_codes WHERE code IN ({placeholders})", written)
+            record_changes(cur, [row[0] for row in cur.fetchall()], "import")
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+    # الأكواد المكررة داخل الدفعة نفسها تُحتسب مرة واحدة
+    new = len(set(codes) - existing)
+    updated = len(set(codes) & existing) if on_conflict == "update" else 0
+    return {"inserted": new, "updated": updated, "skipped": len(rows) - new - updated}
+
+
+class LineReader:
+    """تقسيم جسم الطلب المتدفق إلى أسطر نصية دون قراءته كاملاً"""
+
+    def __init__(self):
+        self.decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        self.pending = ""
+
+    def feed(self, chunk: bytes, final: bool = False) -> List[str]:
+        text = self.pending + self.decoder.decode(chunk, final)
+        lines = text.split("\n")
+        self.pending = "" if final else lines.pop()
+        return [line.rstrip("\r") for line in lines if line.strip()]
+
+
+def parse_lines(fmt: str, lines: List[str], header: Optional[List[str]]):
+    """تحويل الأسطر إلى قواميس؛ يعيد (الترويسة، [(الصف أو None، الخطأ)])"""
+    parsed = []
+    if fmt == "csv":
+        for values in csv.reader(lines):
+            if header is None:
+                header = [h.strip() for h in values]
+                continue
+            if len(values) != len(header):
+                parsed.append((None, f"expected {len(header)} columns, got {len(values)}"))
+            else:
+                parsed.append((dict(zip(header, values)), None))
+    else:
+        for line in lines:
+            try:
+                row = json.loads(line)
+            except ValueError as e:
+                parsed.append((None, f"invalid JSON: {e}"))
+                continue
+            if not isinstance(row, dict):
+                parsed.append((None, "expected a JSON object"))
+            else:
+                parsed.append((row, None))
+    return header, parsed